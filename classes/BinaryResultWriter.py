@@ -0,0 +1,43 @@
+import struct
+from classes.ResultWriter import ResultWriter
+
+# Record layout: puzzle size, status code, elapsed seconds, assignments, backtracks, then one byte per cell (0 when blank)
+RECORD_HEADER = struct.Struct("<BBdII")
+STATUS_CODES = ["solved", "failed", "error"]
+
+
+# Appends fixed-layout binary records, one per puzzle, to the end of the output file
+class BinaryResultWriter(ResultWriter):
+    MODE = "ab"
+
+    def encode(self, result):
+        puzzle_size = result.get("puzzle_size", 0)
+        values = result.get("values") or [None] * (puzzle_size * puzzle_size)
+        header = RECORD_HEADER.pack(
+            puzzle_size,
+            STATUS_CODES.index(result["status"]),
+            result.get("elapsed", 0.0),
+            result.get("assignments", 0),
+            result.get("backtracks", 0)
+        )
+        return header + bytes(v or 0 for v in values)
+
+    # Iterate over the records of a binary results file, one at a time
+    @staticmethod
+    def readResults(path, compression=None):
+        opener = ResultWriter.getCompressor(compression) if compression is not None else open
+        with opener(path, "rb") as results:
+            while True:
+                header = results.read(RECORD_HEADER.size)
+                if len(header) < RECORD_HEADER.size:
+                    return
+                (puzzle_size, status, elapsed, assignments, backtracks) = RECORD_HEADER.unpack(header)
+                cells = results.read(puzzle_size * puzzle_size)
+                yield {
+                    "puzzle_size": puzzle_size,
+                    "status": STATUS_CODES[status],
+                    "values": [v or None for v in cells] if STATUS_CODES[status] == "solved" else None,
+                    "elapsed": elapsed,
+                    "assignments": assignments,
+                    "backtracks": backtracks,
+                }
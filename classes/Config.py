@@ -0,0 +1,41 @@
+from pathlib import Path
+
+# The config file ships alongside the code, so find it from here rather than from the working directory
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "config.ini"
+ROOT_PATH = CONFIG_PATH.parent.parent
+
+
+# Project-wide configuration, read from CONFIG_PATH the first time a value is asked for
+class Config():
+    _parser = None
+
+    @classmethod
+    def get(cls, section, option):
+        return cls._getParser().get(section, option)
+
+    @classmethod
+    def has(cls, section, option):
+        return cls._getParser().has_option(section, option)
+
+    @classmethod
+    def getInt(cls, section, option):
+        return int(cls.get(section, option))
+
+    @classmethod
+    def getFloat(cls, section, option):
+        return float(cls.get(section, option))
+
+    # Relative paths in the config are relative to the repository root, not the working directory
+    @classmethod
+    def getPath(cls, section, option):
+        return str(ROOT_PATH / cls.get(section, option))
+
+    @classmethod
+    def _getParser(cls):
+        if cls._parser is None:
+            import configparser
+            parser = configparser.ConfigParser()
+            if not parser.read(CONFIG_PATH):
+                raise FileNotFoundError(f"Could not read config file {CONFIG_PATH}")
+            cls._parser = parser
+        return cls._parser
@@ -1,20 +1,13 @@
 import time
-import logging
-import configparser
 from classes.SudokuCSP import SudokuCSP
 from classes.PuzzleParser import PuzzleParser
 from classes.Variable import Variable
-
-# Config variables & logger
-config = configparser.ConfigParser()
-config.read('config/config.ini')
-LOGGER_NAME = config.get("LOGGER", "LOGGER_NAME")
-logger = logging.getLogger(LOGGER_NAME)
+from classes.Logger import logger
 
 
 class ConflictDirectedBackjumpingSudokuCSP(SudokuCSP):
-    def __init__(self, file_path, delay=False):
-        super().__init__(file_path=file_path, delay=delay)
+    def __init__(self, file_path=None, delay=False, puzzle=None):
+        super().__init__(file_path=file_path, delay=delay, puzzle=puzzle)
         self.conflict_set_variable_pointer = None
 
     # Modify the solve algorithm to register conflicts when failure occurs
@@ -0,0 +1,12 @@
+import json
+from classes.ResultWriter import ResultWriter
+from classes.PuzzleParser import PuzzleParser
+
+
+# Writes one JSON object per puzzle, with the solution as a compact string alongside the search statistics
+class JsonLinesResultWriter(ResultWriter):
+    def encode(self, result):
+        record = {key: value for (key, value) in result.items() if key != "values"}
+        values = result.get("values")
+        record["solution"] = PuzzleParser.toCompactString(values) if values is not None else None
+        return (json.dumps(record) + "\n").encode()
@@ -1,13 +1,6 @@
-import logging
-import configparser
 from collections import Counter
 from classes.MinimumRemainingValueSudokuCSP import MinimumRemainingValueSudokuCSP
-
-# Config variables & logger
-config = configparser.ConfigParser()
-config.read('config/config.ini')
-LOGGER_NAME = config.get("LOGGER", "LOGGER_NAME")
-logger = logging.getLogger(LOGGER_NAME)
+from classes.Logger import logger
 
 
 class LeastConstrainingValueSudokuCSP(MinimumRemainingValueSudokuCSP):
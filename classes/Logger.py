@@ -1,13 +1,27 @@
 import logging
-import configparser
-
-# Config variables
-config = configparser.ConfigParser()
-config.read('config/config.ini')
-LOGGER_NAME = config.get("LOGGER", "LOGGER_NAME")
-LOG_LEVEL = config.get("LOGGER", "LOG_LEVEL")
+from classes.Config import Config
 
 # Logger setup
 FORMAT = "%(levelname)s:%(module)s:%(lineno)d - %(message)s"
-logging.basicConfig(level=LOG_LEVEL, format=FORMAT)
-logger = logging.getLogger(LOGGER_NAME)
+
+
+# Configure logging from the config file; entry points call this once, importing this module does nothing
+def setupLogging():
+    logging.basicConfig(level=Config.get("LOGGER", "LOG_LEVEL"), format=FORMAT)
+
+
+def getLogger():
+    global _logger
+    if _logger is None:
+        _logger = logging.getLogger(Config.get("LOGGER", "LOGGER_NAME"))
+    return _logger
+
+
+# Stands in for the project logger at module level, only looking it up on first use
+class LazyLogger():
+    def __getattr__(self, name):
+        return getattr(getLogger(), name)
+
+
+_logger = None
+logger = LazyLogger()
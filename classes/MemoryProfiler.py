@@ -0,0 +1,142 @@
+import ast
+import linecache
+import tracemalloc
+from pathlib import Path
+from classes.PuzzleParser import PuzzleParser
+from classes.SudokuCSPFactory import SudokuCSPFactory
+from classes.Logger import logger
+
+# Profiler Globals
+CLASSES_PATH = Path(__file__).resolve().parent
+# Allocation sites are worked out from the function that made the allocation, or failing that the file it's in
+FUNCTION_SITES = {
+    "getConstrainedNeighbors": "neighbors",
+    "getVariableConstraints": "neighbors",
+    "defineSudokuConstraints": "constraints",
+    "getRow": "constraints",
+    "getRowIndices": "constraints",
+    "getCol": "constraints",
+    "getColIndices": "constraints",
+    "getBlock": "constraints",
+    "getBlockIndices": "constraints",
+}
+FILE_SITES = {
+    "Variable.py": "variables",
+    "Constraint.py": "constraints",
+    "PuzzleParser.py": "parser",
+}
+# Within the solvers, lines touching the action history or the assignment trail are told apart by what they touch
+LINE_SITES = [
+    ("self.actions", "history"),
+    ("self.assignment", "trail"),
+    ("conflict_set", "trail"),
+]
+SITES = ["variables", "constraints", "neighbors", "trail", "history", "parser", "other"]
+
+
+# Measures the memory each solver uses on each puzzle with tracemalloc: the peak while solving,
+# what's still held once the solve is done, and which parts of the solver that retained memory belongs to
+class MemoryProfiler():
+    def __init__(self, solvers=None):
+        self.solvers = solvers if solvers is not None else SudokuCSPFactory.getSudokuCSPOptions()
+        # (function start, function end, function name) for each file under classes/, parsed as they're first needed
+        self.functions = dict()
+
+    # Profile every solver against every puzzle, returning each measurement along with averages per size and solver
+    def profile(self, puzzle_paths):
+        puzzles = []
+        for puzzle_path in puzzle_paths:
+            for solver in self.solvers:
+                puzzles.append(self.profilePuzzle(solver, puzzle_path))
+        return {"puzzles": puzzles, "sizes": self.summarize(puzzles)}
+
+    # Parse and solve one puzzle with tracing on, keeping the solver alive until its retained memory has been measured
+    def profilePuzzle(self, solver, puzzle_path):
+        CspClass = SudokuCSPFactory.getSudokuCSP(solver)
+        if (type(CspClass) == str):
+            raise ValueError(CspClass)
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        try:
+            tracemalloc.clear_traces()
+            tracemalloc.reset_peak()
+            (baseline, _) = tracemalloc.get_traced_memory()
+            csp = CspClass(puzzle=PuzzleParser.parsePuzzle(puzzle_path))
+            assn = csp.solve()
+            (current, peak) = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
+        result = {
+            "puzzle": str(puzzle_path),
+            "puzzle_size": csp.puzzle_size,
+            "solver": solver,
+            "status": "failed" if assn == csp.FAILURE else "solved",
+            "peak": peak - baseline,
+            "retained": current - baseline,
+            "sites": self.sites(snapshot),
+        }
+        logger.info(f"{solver} on {puzzle_path}: peak {result['peak']} bytes, retained {result['retained']} bytes")
+        return result
+
+    # Total up a snapshot's allocations by site
+    def sites(self, snapshot):
+        totals = {site: 0 for site in SITES}
+        for stat in snapshot.statistics("lineno"):
+            frame = stat.traceback[0]
+            totals[self.site(frame.filename, frame.lineno)] += stat.size
+        return totals
+
+    def site(self, filename, lineno):
+        path = Path(filename).resolve()
+        if path.parent != CLASSES_PATH:
+            return "other"
+        if path.name in FILE_SITES:
+            return FILE_SITES[path.name]
+        function = self.functionAt(path, lineno)
+        if function in FUNCTION_SITES:
+            return FUNCTION_SITES[function]
+        line = linecache.getline(filename, lineno)
+        for (text, site) in LINE_SITES:
+            if text in line:
+                return site
+        # The solvers build their variables in their constructors, and everything else they keep is domain bookkeeping
+        return "variables" if path.name.endswith("SudokuCSP.py") else "other"
+
+    def functionAt(self, path, lineno):
+        if path not in self.functions:
+            tree = ast.parse(path.read_text())
+            self.functions[path] = [
+                (node.lineno, node.end_lineno, node.name)
+                for node in ast.walk(tree)
+                if isinstance(node, ast.FunctionDef)
+            ]
+        names = [name for (start, end, name) in self.functions[path] if start <= lineno <= end]
+        return names[-1] if len(names) > 0 else None
+
+    # Average and worst-case peak and retained bytes for each solver at each puzzle size
+    @staticmethod
+    def summarize(puzzles):
+        sizes = dict()
+        for result in puzzles:
+            solvers = sizes.setdefault(str(result["puzzle_size"]), dict())
+            solvers.setdefault(result["solver"], []).append(result)
+        return {
+            size: {
+                solver: {
+                    "puzzles": len(results),
+                    "peak_average": sum(r["peak"] for r in results) / len(results),
+                    "peak_max": max(r["peak"] for r in results),
+                    "retained_average": sum(r["retained"] for r in results) / len(results),
+                    "retained_max": max(r["retained"] for r in results),
+                    "sites_average": {
+                        site: sum(r["sites"][site] for r in results) / len(results)
+                        for site in SITES
+                    },
+                }
+                for (solver, results) in solvers.items()
+            }
+            for (size, solvers) in sizes.items()
+        }
@@ -1,12 +1,5 @@
-import logging
-import configparser
 from classes.SudokuCSP import SudokuCSP
-
-# Config variables & logger
-config = configparser.ConfigParser()
-config.read('config/config.ini')
-LOGGER_NAME = config.get("LOGGER", "LOGGER_NAME")
-logger = logging.getLogger(LOGGER_NAME)
+from classes.Logger import logger
 
 
 class MinimumRemainingValueSudokuCSP(SudokuCSP):
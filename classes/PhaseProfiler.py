@@ -0,0 +1,109 @@
+import time
+from classes.PuzzleParser import PuzzleParser
+from classes.Logger import logger
+
+# Profiler Globals
+# The solver methods each phase is timed through; they're looked up on the instance, so subclass overrides are what get timed
+SOLVER_PHASES = [
+    "solve",
+    "getUnassignedVariable",
+    "orderDomainValues",
+    "isAssignmentConsistent",
+    "assignVariable",
+    "unassignVariable",
+]
+# Phases timed outside of the solver's own methods: each constraint's check, and rendering the board
+CONSTRAINT_PHASE = "allDiff"
+PRINT_PHASE = "printPuzzle"
+PHASES = SOLVER_PHASES + [CONSTRAINT_PHASE, PRINT_PHASE]
+
+
+# Attributes solve time to the phases of a solver's search, for any SudokuCSP subclass
+# Each phase records its call count, its cumulative time (including the phases it calls) and its exclusive time,
+# and the exclusive time is also kept per stack of phases, for flamegraph-style collapsed stacks
+class PhaseProfiler():
+    def __init__(self):
+        self.phases = dict()
+        self.stacks = dict()
+        # [phase, start time, time spent in nested phases] for each phase currently running
+        self.stack = []
+
+    # Solve a puzzle with its phases timed, optionally under cProfile as well
+    # Returns whatever the solver's solve returned
+    def profile(self, csp, cprofile=None):
+        self.attach(csp)
+        print_puzzle = PuzzleParser.__dict__[PRINT_PHASE]
+        PuzzleParser.printPuzzle = self._timed(type(csp).__name__, PRINT_PHASE, PuzzleParser.printPuzzle)
+        try:
+            if cprofile is not None:
+                return cprofile.runcall(csp.solve)
+            return csp.solve()
+        finally:
+            PuzzleParser.printPuzzle = print_puzzle
+            self.detach(csp)
+
+    # Shadow the solver's phase methods, and its constraints' checks, with timed versions on this instance only
+    def attach(self, csp):
+        solver = type(csp).__name__
+        for phase in SOLVER_PHASES:
+            setattr(csp, phase, self._timed(solver, phase, getattr(csp, phase)))
+        for constraint in csp.constraints:
+            constraint.constraint_fn = self._timed(solver, CONSTRAINT_PHASE, constraint.constraint_fn)
+
+    def detach(self, csp):
+        for phase in SOLVER_PHASES:
+            del csp.__dict__[phase]
+        for constraint in csp.constraints:
+            constraint.constraint_fn = constraint.constraint_fn.__wrapped__
+
+    # Per solver, each phase's calls, cumulative and exclusive seconds, ordered as in PHASES
+    def report(self):
+        return {
+            solver: {
+                phase: dict(phases[phase])
+                for phase in PHASES
+                if phase in phases
+            }
+            for (solver, phases) in self.phases.items()
+        }
+
+    # Collapsed stacks, "Solver;phase;nested phase <microseconds>", as read by flamegraph.pl and speedscope
+    def collapsedStacks(self):
+        return [
+            f"{';'.join(stack)} {round(seconds * 1000000)}"
+            for (stack, seconds) in sorted(self.stacks.items())
+        ]
+
+    def logReport(self):
+        for (solver, phases) in self.report().items():
+            logger.critical(f"--- PROFILE: {solver}")
+            for (phase, stats) in phases.items():
+                logger.critical(f"{phase:<24} calls {stats['calls']:>9}  cumulative {stats['cumulative']:.4f}s  exclusive {stats['exclusive']:.4f}s")
+
+    def _timed(self, solver, phase, fn):
+        def timed(*args, **kwargs):
+            # solve recurses into itself; only the outermost call is a phase of its own
+            if phase == "solve" and len(self.stack) > 0:
+                return fn(*args, **kwargs)
+            self.stack.append([phase, time.perf_counter(), 0.0])
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._record(solver)
+        timed.__wrapped__ = fn
+        return timed
+
+    def _record(self, solver):
+        stack_names = tuple(frame[0] for frame in self.stack)
+        (phase, start, nested) = self.stack.pop()
+        elapsed = time.perf_counter() - start
+        if len(self.stack) > 0:
+            self.stack[-1][2] += elapsed
+        stats = self.phases.setdefault(solver, dict()).setdefault(phase, {"calls": 0, "cumulative": 0.0, "exclusive": 0.0})
+        stats["calls"] += 1
+        stats["exclusive"] += elapsed - nested
+        # A phase nested inside itself is already counted by the outer call
+        if phase not in stack_names[:-1]:
+            stats["cumulative"] += elapsed
+        stack = (solver,) + stack_names
+        self.stacks[stack] = self.stacks.get(stack, 0.0) + (elapsed - nested)
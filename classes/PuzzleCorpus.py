@@ -0,0 +1,99 @@
+import mmap
+import struct
+from classes.PuzzleParser import PuzzleParser
+from classes.Logger import logger
+
+# Corpus Globals
+# Header layout: magic, format version, puzzle size, reserved, puzzle count, file offset of the index
+MAGIC = b"SDKC"
+VERSION = 1
+HEADER = struct.Struct("<4sBBHQQ")
+# The index holds one unsigned 64-bit file offset per puzzle
+INDEX_FORMAT = "Q"
+INDEX_ENTRY_SIZE = struct.calcsize("<" + INDEX_FORMAT)
+
+
+# A binary puzzle corpus: a fixed header, then one byte per cell for each puzzle (0 for blanks), then an offset index
+# Reading memory-maps the file, so puzzles are handed out as zero-copy memoryview slices
+class PuzzleCorpus():
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, "rb")
+        # Empty files can't be mapped and short ones have no header; either way, don't leak the open file
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.file.close()
+            raise ValueError(f"{path} is not a version {VERSION} puzzle corpus")
+        try:
+            (magic, version, puzzle_size, _, count, index_offset) = HEADER.unpack_from(self.map, 0)
+        except struct.error:
+            magic = None
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a version {VERSION} puzzle corpus")
+        self.puzzle_size = puzzle_size
+        self.cell_count = puzzle_size * puzzle_size
+        self.count = count
+        self.view = memoryview(self.map)
+        self.offsets = self.view[index_offset:(index_offset + count * INDEX_ENTRY_SIZE)].cast(INDEX_FORMAT)
+
+    def __len__(self):
+        return self.count
+
+    # The cells of the i-th puzzle, row-major, as a read-only view into the mapped file
+    def cells(self, i):
+        offset = self.offsets[i]
+        return self.view[offset:(offset + self.cell_count)]
+
+    # The cells of puzzles start to stop (exclusive) as one contiguous view, for handing whole ranges to a worker
+    def cellRange(self, start, stop):
+        if stop <= start:
+            return self.view[0:0]
+        return self.view[self.offsets[start]:(self.offsets[stop - 1] + self.cell_count)]
+
+    # The i-th puzzle in the (puzzle_size, values) form SudokuCSP expects, without copying the cells
+    def puzzle(self, i):
+        return (self.puzzle_size, self.cells(i))
+
+    # Every memoryview handed out must be released before the map can be closed
+    def close(self):
+        if hasattr(self, "offsets"):
+            self.offsets.release()
+            self.view.release()
+        self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Write (puzzle_size, values) puzzles to a new corpus, streaming cells straight to disk
+    @staticmethod
+    def write(path, puzzles):
+        offsets = []
+        puzzle_size = None
+        with open(path, "wb") as corpus:
+            corpus.write(HEADER.pack(MAGIC, VERSION, 0, 0, 0, 0))
+            for (size, values) in puzzles:
+                if puzzle_size is None:
+                    puzzle_size = size
+                if size != puzzle_size:
+                    raise ValueError(f"A corpus holds puzzles of one size, got {size} after {puzzle_size}")
+                if len(values) != size * size or any(type(v) == str for v in values):
+                    raise ValueError(f"Invalid puzzle definition in puzzle #{len(offsets)}")
+                offsets.append(corpus.tell())
+                corpus.write(bytes(v or 0 for v in values))
+            index_offset = corpus.tell()
+            corpus.write(struct.pack(f"<{len(offsets)}{INDEX_FORMAT}", *offsets))
+            corpus.seek(0)
+            corpus.write(HEADER.pack(MAGIC, VERSION, puzzle_size or 0, 0, len(offsets), index_offset))
+        return len(offsets)
+
+    # Convert puzzles in the text format into a single corpus file
+    @classmethod
+    def convert(cls, puzzle_paths, path):
+        logger.info(f"converting {len(puzzle_paths)} puzzles into {path}")
+        return cls.write(path, (PuzzleParser.parsePuzzle(puzzle_path) for puzzle_path in puzzle_paths))
@@ -0,0 +1,131 @@
+import math
+import random
+from classes.Config import Config
+from classes.SolveJob import SolveJob
+from classes.SudokuSession import SudokuSession
+from classes.SudokuCSPFactory import SudokuCSPFactory
+from classes.Logger import logger
+
+
+# Generates puzzles with a unique solution, rating their difficulty by how hard a reference solver has to search
+# Everything random comes from one seeded generator, so the same seed always gives the same puzzles
+class PuzzleGenerator():
+    # Difficulty ratings
+    EASY = "easy"
+    HARD = "hard"
+    EVIL = "evil"
+    DIFFICULTIES = [EASY, HARD, EVIL]
+
+    def __init__(self, puzzle_size, seed=None, solver=None):
+        self.puzzle_size = puzzle_size
+        self.puzzle_size_root = int(math.sqrt(puzzle_size))
+        if self.puzzle_size_root * self.puzzle_size_root != puzzle_size:
+            raise ValueError(f"Puzzle sizes must be square numbers, got {puzzle_size}")
+        self.random = random.Random(seed)
+        self.solver = solver if solver is not None else Config.get("GENERATOR", "REFERENCE_SOLVER")
+        self.CspClass = SudokuCSPFactory.getSudokuCSP(self.solver)
+        if (type(self.CspClass) == str):
+            raise ValueError(self.CspClass)
+
+    # Generate a puzzle, removing cells for as long as the solution stays unique or until min_givens are left
+    # Returns a dict of the puzzle's values, its solution, difficulty rating and the search statistics behind it
+    def generate(self, min_givens=0):
+        solution = self.solvedGrid()
+        values = self.removeCells(solution, min_givens=min_givens)
+        (difficulty, assignments, backtracks) = self.rate(values)
+        return {
+            "puzzle_size": self.puzzle_size,
+            "values": values,
+            "solution": solution,
+            "givens": sum(1 for v in values if v is not None),
+            "difficulty": difficulty,
+            "assignments": assignments,
+            "backtracks": backtracks,
+        }
+
+    # Keep generating puzzles until there are count of every difficulty, giving up after max_attempts puzzles
+    # Returns a dict of each difficulty to its puzzles, in the order they were generated
+    def generateSets(self, count, min_givens=0, max_attempts=None):
+        sets = {difficulty: [] for difficulty in self.DIFFICULTIES}
+        attempts = 0
+        while any(len(puzzles) < count for puzzles in sets.values()):
+            if max_attempts is not None and attempts >= max_attempts:
+                missing = [difficulty for (difficulty, puzzles) in sets.items() if len(puzzles) < count]
+                logger.warning(f"Gave up after {attempts} puzzles without filling {', '.join(missing)}")
+                break
+            attempts += 1
+            puzzle = self.generate(min_givens=min_givens)
+            if len(sets[puzzle["difficulty"]]) < count:
+                sets[puzzle["difficulty"]].append(puzzle)
+        return sets
+
+    # A random complete grid: start from a patterned grid, which satisfies every constraint,
+    # and shuffle the digits, the rows within each band, the bands, the columns within each stack and the stacks
+    def solvedGrid(self):
+        size = self.puzzle_size
+        root = self.puzzle_size_root
+        digits = list(range(1, size + 1))
+        self.random.shuffle(digits)
+        rows = self._shuffledLines()
+        cols = self._shuffledLines()
+        return [
+            digits[((root * (r % root)) + (r // root) + c) % size]
+            for r in rows
+            for c in cols
+        ]
+
+    # Blank cells one at a time in random order, putting back any whose removal makes the solution ambiguous
+    # Cells are set and cleared through one SudokuSession, so each step only touches the cell's peers,
+    # and each uniqueness check is capped at MAX_SEARCH_NODES; a cell whose check hits the cap is kept as a given
+    def removeCells(self, solution, min_givens=0):
+        session = SudokuSession(solver=self.solver, puzzle=(self.puzzle_size, solution))
+        max_nodes = Config.getInt("GENERATOR", "MAX_SEARCH_NODES")
+        givens = len(solution)
+        capped = 0
+        order = list(range(len(solution)))
+        self.random.shuffle(order)
+        for index in order:
+            if givens <= min_givens:
+                break
+            session.clearCell(index)
+            count = session.csp.countSolutions(limit=2, max_nodes=max_nodes)
+            if count == 1:
+                givens -= 1
+                continue
+            session.setCell(index, solution[index])
+            if count is None:
+                capped += 1
+        if capped > 0:
+            logger.info(f"Kept {capped} cells whose uniqueness check hit {max_nodes} nodes")
+        return [v.value for v in session.variables]
+
+    # Rate a puzzle from the reference solver's search: the more it has to backtrack per blank cell, the harder it is
+    def rate(self, values):
+        result = SolveJob.run(self.solver, (self.puzzle_size, values))
+        blanks = sum(1 for v in values if v is None)
+        backtrack_ratio = (result["backtracks"] / blanks) if blanks > 0 else 0.0
+        if backtrack_ratio <= self.threshold("EASY_MAX_BACKTRACK_RATIO"):
+            difficulty = self.EASY
+        elif backtrack_ratio <= self.threshold("HARD_MAX_BACKTRACK_RATIO"):
+            difficulty = self.HARD
+        else:
+            difficulty = self.EVIL
+        logger.debug(f"Rated puzzle {difficulty} with {result['backtracks']} backtracks over {blanks} blanks")
+        return (difficulty, result["assignments"], result["backtracks"])
+
+    # A rating threshold, taken from <option>_<puzzle size> when the config sets one for this size
+    def threshold(self, option):
+        sized_option = f"{option}_{self.puzzle_size}"
+        return Config.getFloat("GENERATOR", sized_option if Config.has("GENERATOR", sized_option) else option)
+
+    # A random order of rows (or columns) that keeps each band (or stack) together
+    def _shuffledLines(self):
+        root = self.puzzle_size_root
+        bands = list(range(root))
+        self.random.shuffle(bands)
+        lines = []
+        for band in bands:
+            offsets = list(range(root))
+            self.random.shuffle(offsets)
+            lines += [(band * root) + offset for offset in offsets]
+        return lines
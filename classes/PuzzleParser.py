@@ -1,16 +1,16 @@
+import io
 import logging
-import configparser
 from pathlib import Path
-
-# Config variables & logger
-config = configparser.ConfigParser()
-config.read('config/config.ini')
-LOGGER_NAME = config.get("LOGGER", "LOGGER_NAME")
-logger = logging.getLogger(LOGGER_NAME)
+from classes.Logger import logger
 
 # Parser Globals
 LINE_SEP = "\n"
 VALUE_SEP = ","
+# One character per cell for compact strings, enough for puzzles up to 25x25
+COMPACT_ALPHABET = "123456789ABCDEFGHIJKLMNOP"
+COMPACT_BLANK = "."
+# The largest puzzle the compact format, and so the solvers' outputs, can represent
+MAX_PUZZLE_SIZE = len(COMPACT_ALPHABET)
 
 
 class PuzzleParser():
@@ -18,17 +18,32 @@ class PuzzleParser():
     def parsePuzzle(cls, file_path):
         logger.info(f"loading puzzle data from {file_path}")
         with Path(file_path).open() as puzzle:
-            size_line = cls._nextLine(puzzle)
-            puzzle_size = int(size_line[0])
-            values = []
-            for _ in range(puzzle_size):
-                row = cls._nextLine(puzzle)
-                row_values = cls._getValues(row)
-                values += cls._parseValuesFromStrings(puzzle_size, row_values)
-            return (puzzle_size, values)
+            return cls._parseLines(puzzle)
+
+    # Parse a puzzle already held in memory, using the same format as the puzzle files
+    @classmethod
+    def parsePuzzleString(cls, puzzle_string):
+        return cls._parseLines(io.StringIO(puzzle_string))
+
+    # Render a puzzle's values back into the puzzle file format, size line included
+    @classmethod
+    def formatPuzzle(cls, puzzle_size, values):
+        lines = [str(puzzle_size)]
+        for i in range(puzzle_size):
+            row = values[(i * puzzle_size):((i + 1) * puzzle_size)]
+            lines.append(VALUE_SEP.join(cls._parseStringsFromValues(puzzle_size, row)))
+        return LINE_SEP.join(lines) + LINE_SEP
+
+    # Render values as a single line, one character per cell in row-major order
+    @staticmethod
+    def toCompactString(values):
+        return "".join(COMPACT_ALPHABET[v - 1] if v is not None else COMPACT_BLANK for v in values)
 
     @classmethod
     def printPuzzle(cls, puzzle, level=logging.INFO):
+        # Rendering the board isn't free, so skip it entirely when nobody is listening
+        if not logger.isEnabledFor(level):
+            return
         puzzle_size = puzzle.puzzle_size
         values = [v.value for v in puzzle.variables]
         logger.log(level, '---Current Solution---')
@@ -39,6 +54,17 @@ class PuzzleParser():
             logger.log(level, VALUE_SEP.join(row))
         logger.log(level, '---------------------\n')
 
+    @classmethod
+    def _parseLines(cls, puzzle):
+        size_line = cls._nextLine(puzzle)
+        puzzle_size = int(size_line)
+        values = []
+        for _ in range(puzzle_size):
+            row = cls._nextLine(puzzle)
+            row_values = cls._getValues(row)
+            values += cls._parseValuesFromStrings(puzzle_size, row_values)
+        return (puzzle_size, values)
+
     @staticmethod
     def _nextLine(file):
         return file.readline().replace(LINE_SEP, '')
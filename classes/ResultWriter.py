@@ -0,0 +1,76 @@
+import io
+import sys
+import importlib
+from abc import ABC, abstractmethod
+from classes.Config import Config
+
+# Writer Globals
+STDOUT_PATH = "-"
+# Compressors by module and class name, imported only when used
+COMPRESSORS = {
+    "gzip": ("gzip", "GzipFile"),
+    "bz2": ("bz2", "BZ2File"),
+    "lzma": ("lzma", "LZMAFile"),
+}
+
+
+# Base class for result sinks: results are encoded one at a time and written through a fixed-size buffer,
+# so memory use doesn't grow with the number of puzzles solved
+class ResultWriter(ABC):
+    # Subclasses that should only ever add to an existing file override this with "ab"
+    MODE = "wb"
+
+    def __init__(self, path, compression=None, buffer_size=None):
+        if compression is not None and compression not in COMPRESSORS:
+            raise ValueError(f"Unknown compression {compression}, options are: {self.getCompressionOptions()}")
+        if buffer_size is None:
+            buffer_size = Config.getInt("OUTPUT", "BUFFER_SIZE")
+        self.path = path
+        self.count = 0
+        raw = sys.stdout.buffer if path == STDOUT_PATH else open(path, self.MODE)
+        self.raw = raw
+        if compression is not None:
+            raw = self.getCompressor(compression)(fileobj=raw, mode=self.MODE)
+        self.compressed = raw
+        self.stream = io.BufferedWriter(raw, buffer_size=buffer_size)
+
+    @staticmethod
+    def getCompressionOptions():
+        return list(COMPRESSORS.keys())
+
+    # The file class for a compression option, which also opens compressed files for reading
+    @staticmethod
+    def getCompressor(compression):
+        (module_name, class_name) = COMPRESSORS[compression]
+        return getattr(importlib.import_module(module_name), class_name)
+
+    # Encode a single result dict (as produced by SolveJob) into the bytes that get written
+    @abstractmethod
+    def encode(self, result):
+        pass
+
+    def write(self, result):
+        self.stream.write(self.encode(result))
+        self.count += 1
+
+    def flush(self):
+        self.stream.flush()
+
+    def close(self):
+        # Closing the buffer closes the compressor (writing its trailer); stdout gets flushed but left open
+        if self.raw is sys.stdout.buffer:
+            self.stream.flush()
+            self.stream.detach()
+            if self.compressed is not self.raw:
+                self.compressed.close()
+            self.raw.flush()
+        else:
+            self.stream.close()
+            if self.compressed is not self.raw:
+                self.raw.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
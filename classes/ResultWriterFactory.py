@@ -0,0 +1,26 @@
+import importlib
+
+
+class ResultWriterFactory():
+    DEFAULT = 'solution'
+    # Writers are registered by module and class name, and only imported once they're asked for
+    result_writer_options = {
+        DEFAULT: ('classes.SolutionResultWriter', 'SolutionResultWriter'),
+        'jsonl': ('classes.JsonLinesResultWriter', 'JsonLinesResultWriter'),
+        'binary': ('classes.BinaryResultWriter', 'BinaryResultWriter')
+    }
+
+    @classmethod
+    def getResultWriterOptions(cls):
+        return list(cls.result_writer_options.keys())
+
+    @classmethod
+    def getResultWriter(cls, ty):
+        if ty not in cls.result_writer_options:
+            return f"No ResultWriter of type {ty} available"
+        (module_name, class_name) = cls.result_writer_options[ty]
+        return getattr(importlib.import_module(module_name), class_name)
+
+    @classmethod
+    def defaultResultWriterType(cls):
+        return cls.DEFAULT
@@ -0,0 +1,66 @@
+import time
+import bisect
+
+
+class ServiceMetrics():
+    # Upper bounds (in seconds) of the latency histogram buckets; anything slower lands in the overflow bucket
+    LATENCY_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30]
+
+    def __init__(self):
+        self.start_time = time.monotonic()
+        self.received = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.completed = 0
+        self.failed = 0
+        self.errors = 0
+        self.batches = 0
+        self.latency_counts = [0] * (len(self.LATENCY_BUCKETS) + 1)
+        self.latency_sum = 0.0
+
+    def recordReceived(self):
+        self.received += 1
+
+    def recordRejected(self):
+        self.rejected += 1
+
+    def recordTimeout(self):
+        self.timed_out += 1
+
+    def recordBatch(self):
+        self.batches += 1
+
+    # Record a finished request: its solver status and its end-to-end latency (queueing included)
+    def recordResult(self, status, latency):
+        if status == "solved":
+            self.completed += 1
+        elif status == "failed":
+            self.failed += 1
+        else:
+            self.errors += 1
+        self.latency_counts[bisect.bisect_left(self.LATENCY_BUCKETS, latency)] += 1
+        self.latency_sum += latency
+
+    def snapshot(self, queue_depth=0, in_flight=0):
+        uptime = time.monotonic() - self.start_time
+        finished = self.completed + self.failed + self.errors
+        buckets = [str(bound) for bound in self.LATENCY_BUCKETS] + ["+Inf"]
+        return {
+            "uptime": uptime,
+            "received": self.received,
+            "rejected": self.rejected,
+            "timed_out": self.timed_out,
+            "completed": self.completed,
+            "failed": self.failed,
+            "errors": self.errors,
+            "batches": self.batches,
+            "throughput": (finished / uptime) if uptime > 0 else 0.0,
+            "queue_depth": queue_depth,
+            "in_flight": in_flight,
+            "latency": {
+                "count": finished,
+                "sum": self.latency_sum,
+                "mean": (self.latency_sum / finished) if finished > 0 else 0.0,
+                "histogram": dict(zip(buckets, self.latency_counts)),
+            },
+        }
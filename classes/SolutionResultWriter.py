@@ -0,0 +1,10 @@
+from classes.ResultWriter import ResultWriter
+from classes.PuzzleParser import PuzzleParser
+
+
+# Writes one line per puzzle: the compact solution string, or the result status when there is no solution
+class SolutionResultWriter(ResultWriter):
+    def encode(self, result):
+        values = result.get("values")
+        line = PuzzleParser.toCompactString(values) if values is not None else result["status"]
+        return (line + "\n").encode()
@@ -0,0 +1,105 @@
+import math
+import time
+from classes.PuzzleParser import PuzzleParser, MAX_PUZZLE_SIZE
+from classes.PuzzleCorpus import PuzzleCorpus
+from classes.SudokuCSPFactory import SudokuCSPFactory
+from classes.Logger import logger
+
+
+class SolveJob():
+    # Result statuses
+    SOLVED = "solved"
+    FAILED = "failed"
+    ERROR = "error"
+
+    # Solve a single (puzzle_size, values) puzzle with the requested solver type
+    # Results are plain dicts so that they can be sent back from worker processes cheaply
+    @classmethod
+    def run(cls, solver, puzzle, job_id=None, delay=False):
+        CspClass = SudokuCSPFactory.getSudokuCSP(solver)
+        if (type(CspClass) == str):
+            return cls._errorResult(job_id, solver, CspClass)
+        start = time.perf_counter()
+        csp = CspClass(puzzle=puzzle, delay=delay)
+        assn = csp.solve()
+        elapsed = time.perf_counter() - start
+        (assignments, backtracks) = cls.searchStatistics(csp)
+        solved = assn != csp.FAILURE
+        return {
+            "id": job_id,
+            "solver": solver,
+            "puzzle_size": csp.puzzle_size,
+            "status": cls.SOLVED if solved else cls.FAILED,
+            "values": [v.value for v in csp.variables] if solved else None,
+            "elapsed": elapsed,
+            "assignments": assignments,
+            "backtracks": backtracks,
+        }
+
+    # Solve a puzzle given as text in the puzzle file format
+    @classmethod
+    def runString(cls, solver, puzzle_string, job_id=None):
+        size_error = cls.checkPuzzleSize(puzzle_string)
+        if size_error is not None:
+            return cls._errorResult(job_id, solver, size_error)
+        try:
+            puzzle = PuzzleParser.parsePuzzleString(puzzle_string)
+        except Exception as e:
+            return cls._errorResult(job_id, solver, f"Could not parse puzzle: {e}")
+        (puzzle_size, values) = puzzle
+        if len(values) != puzzle_size * puzzle_size or any(type(v) == str for v in values):
+            return cls._errorResult(job_id, solver, "Invalid puzzle definition")
+        try:
+            return cls.run(solver, puzzle, job_id=job_id)
+        except Exception as e:
+            logger.error(e)
+            return cls._errorResult(job_id, solver, str(e))
+
+    # Parsing takes time quadratic in the puzzle size, so check the size line before handing the rest to the parser
+    # Returns an error message, or None if the size is one the solvers can handle
+    @staticmethod
+    def checkPuzzleSize(puzzle_string):
+        size_line = puzzle_string.partition("\n")[0].strip()
+        if not size_line.isdecimal() or len(size_line) > 2:
+            return f"Puzzle size must be a number no larger than {MAX_PUZZLE_SIZE}"
+        puzzle_size = int(size_line)
+        if puzzle_size == 0 or puzzle_size > MAX_PUZZLE_SIZE or math.isqrt(puzzle_size) ** 2 != puzzle_size:
+            return f"Puzzle size must be a square number no larger than {MAX_PUZZLE_SIZE}, got {puzzle_size}"
+        return None
+
+    # Solve a batch of (job_id, solver, puzzle_string) jobs in one go, amortizing the cost of a round trip to a worker
+    @classmethod
+    def runBatch(cls, jobs):
+        return [cls.runString(solver, puzzle_string, job_id=job_id) for (job_id, solver, puzzle_string) in jobs]
+
+    # Solve puzzles start to stop (exclusive) of a binary corpus; each worker maps the file itself, so no puzzles are pickled
+    @classmethod
+    def runCorpusRange(cls, solver, corpus_path, start, stop, delay=False):
+        with PuzzleCorpus(corpus_path) as corpus:
+            results = []
+            for i in range(start, min(stop, len(corpus))):
+                with corpus.cells(i) as cells:
+                    results.append(cls.run(solver, (corpus.puzzle_size, cells), job_id=i, delay=delay))
+            return results
+
+    # Pool initializer: import every solver up front so the first request doesn't pay for it
+    @staticmethod
+    def warmUp():
+        for option in SudokuCSPFactory.getSudokuCSPOptions():
+            SudokuCSPFactory.getSudokuCSP(option)
+
+    # Count the assignments and backtracks a solver made, using its action history
+    @staticmethod
+    def searchStatistics(csp):
+        assignments = sum(1 for act in csp.actions if act.startswith("Assign"))
+        backtracks = sum(1 for act in csp.actions if act.startswith("Unassigned"))
+        return (assignments, backtracks)
+
+    @classmethod
+    def _errorResult(cls, job_id, solver, error):
+        return {
+            "id": job_id,
+            "solver": solver,
+            "status": cls.ERROR,
+            "error": error,
+        }
@@ -0,0 +1,196 @@
+import json
+import time
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from classes.SolveJob import SolveJob
+from classes.ServiceMetrics import ServiceMetrics
+from classes.SudokuCSPFactory import SudokuCSPFactory
+from classes.Logger import logger
+
+# HTTP Globals
+HTTP_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    503: "Service Unavailable",
+    504: "Gateway Timeout",
+}
+MAX_BODY_BYTES = 1 << 20
+
+
+class SolveService():
+    def __init__(self, host, port, workers, queue_limit, batch_size, request_timeout):
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.batch_size = batch_size
+        self.request_timeout = request_timeout
+        self.metrics = ServiceMetrics()
+        self.in_flight = 0
+        self.queue = None
+        self.executor = None
+        self.server = None
+        self.dispatchers = []
+        self.next_job_id = 0
+
+    # Start the warm worker pool, one dispatcher per worker, and the HTTP front end
+    async def start(self):
+        self.queue = asyncio.Queue(maxsize=self.queue_limit)
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=SolveJob.warmUp)
+        # Bring the workers up before listening, otherwise forked workers inherit open client connections
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[loop.run_in_executor(self.executor, SolveJob.runBatch, []) for _ in range(self.workers)])
+        self.dispatchers = [asyncio.ensure_future(self._dispatch()) for _ in range(self.workers)]
+        self.server = await asyncio.start_server(self._handleConnection, self.host, self.port)
+        # Port 0 asks the OS for a free port; record the one we actually got
+        self.port = self.server.sockets[0].getsockname()[1]
+        logger.critical(f"Solve service listening on http://{self.host}:{self.port}")
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+        for dispatcher in self.dispatchers:
+            dispatcher.cancel()
+        await asyncio.gather(*self.dispatchers, return_exceptions=True)
+        self.executor.shutdown(wait=True)
+
+    async def serveForever(self):
+        await self.start()
+        try:
+            await self.server.serve_forever()
+        finally:
+            await self.stop()
+
+    # Queue puzzles for solving, waiting at most timeout seconds for all of their results
+    # Raises asyncio.QueueFull when the queue can't take every puzzle, and asyncio.TimeoutError on timeout
+    async def submit(self, puzzle_strings, solver, timeout=None):
+        timeout = self.request_timeout if timeout is None else timeout
+        for _ in puzzle_strings:
+            self.metrics.recordReceived()
+        if (self.queue_limit - self.queue.qsize()) < len(puzzle_strings):
+            for _ in puzzle_strings:
+                self.metrics.recordRejected()
+            raise asyncio.QueueFull()
+        loop = asyncio.get_running_loop()
+        futures = []
+        for puzzle_string in puzzle_strings:
+            future = loop.create_future()
+            self.queue.put_nowait((self._nextJobId(), solver, puzzle_string, future, time.monotonic()))
+            futures.append(future)
+        try:
+            return await asyncio.wait_for(asyncio.gather(*futures), timeout)
+        except asyncio.TimeoutError:
+            # Timed out puzzles that haven't been dispatched yet are skipped by the dispatchers
+            for future in futures:
+                if not future.done():
+                    future.cancel()
+                if future.cancelled():
+                    self.metrics.recordTimeout()
+            raise
+
+    def metricsSnapshot(self):
+        queue_depth = self.queue.qsize() if self.queue is not None else 0
+        return self.metrics.snapshot(queue_depth=queue_depth, in_flight=self.in_flight)
+
+    # Pull up to batch_size queued puzzles at a time and hand them to the pool as a single task
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            while len(batch) < self.batch_size and not self.queue.empty():
+                batch.append(self.queue.get_nowait())
+            batch = [item for item in batch if not item[3].done()]
+            if len(batch) == 0:
+                continue
+            self.in_flight += len(batch)
+            self.metrics.recordBatch()
+            jobs = [(job_id, solver, puzzle_string) for (job_id, solver, puzzle_string, _, _) in batch]
+            try:
+                results = await loop.run_in_executor(self.executor, SolveJob.runBatch, jobs)
+            except Exception as e:
+                logger.error(e)
+                results = [SolveJob._errorResult(job_id, solver, str(e)) for (job_id, solver, _) in jobs]
+            finally:
+                self.in_flight -= len(batch)
+            for ((_, _, _, future, enqueued), result) in zip(batch, results):
+                # Requests that timed out while their batch was running were already counted as timed out
+                if future.done():
+                    continue
+                self.metrics.recordResult(result["status"], time.monotonic() - enqueued)
+                future.set_result(result)
+
+    def _nextJobId(self):
+        self.next_job_id += 1
+        return self.next_job_id
+
+    ######################
+    # HTTP Front End
+    #####
+    async def _handleConnection(self, reader, writer):
+        try:
+            (status, payload) = await self._handleRequest(reader)
+        except Exception as e:
+            logger.error(e)
+            (status, payload) = (400, {"error": str(e)})
+        body = json.dumps(payload).encode()
+        head = (
+            f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(head.encode() + body)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _handleRequest(self, reader):
+        request_line = (await reader.readline()).decode().strip()
+        if not request_line:
+            return (400, {"error": "Empty request"})
+        (method, path, _) = request_line.split(" ", 2)
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode().strip()
+            if not line:
+                break
+            (name, value) = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+        content_length = int(headers.get("content-length", 0))
+        if content_length > MAX_BODY_BYTES:
+            return (413, {"error": "Request body too large"})
+        body = await reader.readexactly(content_length) if content_length > 0 else b""
+
+        if path == "/metrics":
+            if method != "GET":
+                return (405, {"error": "Use GET for /metrics"})
+            return (200, self.metricsSnapshot())
+        if path == "/solve":
+            if method != "POST":
+                return (405, {"error": "Use POST for /solve"})
+            return await self._handleSolve(json.loads(body or b"{}"))
+        return (404, {"error": f"No such endpoint {path}"})
+
+    # Accepts {"puzzle": "<puzzle text>"} or {"puzzles": [...]}, with optional "solver" and "timeout" keys
+    async def _handleSolve(self, request):
+        solver = request.get("solver", SudokuCSPFactory.defaultSudokuCSPType())
+        if solver not in SudokuCSPFactory.getSudokuCSPOptions():
+            return (400, {"error": f"No SudokuCSP of type {solver} available"})
+        is_batch = "puzzles" in request
+        puzzle_strings = request["puzzles"] if is_batch else [request.get("puzzle")]
+        if type(puzzle_strings) != list or len(puzzle_strings) == 0 or not all(type(p) == str for p in puzzle_strings):
+            return (400, {"error": "Expected a puzzle string, or a list of puzzle strings"})
+        # A batch that could never fit in the queue isn't worth retrying
+        if len(puzzle_strings) > self.queue_limit:
+            return (413, {"error": f"Batches can hold at most {self.queue_limit} puzzles"})
+        try:
+            results = await self.submit(puzzle_strings, solver, timeout=request.get("timeout"))
+        except asyncio.QueueFull:
+            return (503, {"error": "Solve queue is full, try again later"})
+        except asyncio.TimeoutError:
+            return (504, {"error": "Timed out waiting for a solution"})
+        return (200, {"results": results} if is_batch else results[0])
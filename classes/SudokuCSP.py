@@ -1,16 +1,9 @@
 import math
 import time
-import logging
-import configparser
 from classes.PuzzleParser import PuzzleParser
 from classes.Variable import Variable
 from classes.Constraint import Constraint
-
-# Config variables & logger
-config = configparser.ConfigParser()
-config.read('config/config.ini')
-LOGGER_NAME = config.get("LOGGER", "LOGGER_NAME")
-logger = logging.getLogger(LOGGER_NAME)
+from classes.Logger import logger
 
 
 class SudokuCSP():
@@ -18,21 +11,28 @@ class SudokuCSP():
     FAILURE = "FAILURE"
     SLEEP_DELAY = .3
 
-    def __init__(self, file_path, delay=False):
+    # Puzzles are read from file_path, unless an already parsed (puzzle_size, values) pair is passed as puzzle
+    def __init__(self, file_path=None, delay=False, puzzle=None):
         self.delay = delay
-        (puzzle_size, values) = PuzzleParser.parsePuzzle(file_path)
+        (puzzle_size, values) = puzzle if puzzle is not None else PuzzleParser.parsePuzzle(file_path)
         # just to track the domain somewhere
         self.puzzle_size = int(puzzle_size)
         self.puzzle_size_root = int(math.sqrt(puzzle_size))
         domain = [x + 1 for x in range(0, self.puzzle_size)]
+        # Blank cells are None when parsed from text, and 0 when read from a binary corpus
         self.variables = [
-            Variable(id=i, domain=domain, value=value)
+            Variable(id=i, domain=domain, value=value or None)
             for (i, value) in enumerate(values)
         ]
         self.constraints = []
+        # Neighbors and constraints of each variable, filled in by id as they're first asked for
+        self.neighbors = dict()
+        self.variable_constraints = dict()
         self.assignment = dict()
         self.defineSudokuConstraints()
         self.updateDomainsAfterConstraints()
+        # Givens that already clash can never be part of a solution; checked once here so each assignment only needs its own constraints
+        self.givens_consistent = self.allConstraintsSatisfied()
         self.actions = []
 
     def solve(self):
@@ -57,12 +57,46 @@ class SudokuCSP():
         return self.FAILURE
 
     # Locally assign and unassign variable to check its consistency,
+    # Only the constraints the variable belongs to can be broken by assigning it, so those are the only ones checked
     def isAssignmentConsistent(self, variable, value):
+        if not self.givens_consistent:
+            return False
         self.assignVariable(variable, value, testing_assignment=True)
-        isConsistent = self.allConstraintsSatisfied()
+        isConsistent = all(constraint.isSatisfied() for constraint in self.getVariableConstraints(variable))
         self.unassignVariable(variable, testing_assignment=True)
         return isConsistent
 
+    # Count the solutions that can be reached from the current assignment, stopping once limit have been found
+    # A count of 1 with limit=2 means the solution is unique; the variables and history are left as they were found
+    # With max_nodes, the search gives up after that many assignments and returns None, as the count is unknown
+    def countSolutions(self, limit=2, max_nodes=None):
+        history_length = len(self.actions)
+        self.search_nodes_left = max_nodes
+        count = self._countSolutions(limit)
+        del self.actions[history_length:]
+        if self.search_nodes_left is not None and self.search_nodes_left < 0:
+            return None
+        return count
+
+    # Looking for the next variable already scans for unassigned ones, so the goal test only runs once there are none
+    def _countSolutions(self, limit):
+        next_variable = self.getUnassignedVariable()
+        if next_variable is None:
+            return 1 if self.allConstraintsSatisfied() else 0
+        count = 0
+        for value in self.orderDomainValues(next_variable):
+            if (self.isAssignmentConsistent(next_variable, value)):
+                if self.search_nodes_left is not None:
+                    self.search_nodes_left -= 1
+                    if self.search_nodes_left < 0:
+                        break
+                self.assignVariable(next_variable, value)
+                count += self._countSolutions(limit - count)
+                self.unassignVariable(next_variable)
+                if count >= limit or (self.search_nodes_left is not None and self.search_nodes_left < 0):
+                    break
+        return count
+
     # Assign a variable a value, and any other associated actions or cleanup
     def assignVariable(self, variable, value, testing_assignment=False):
         try:
@@ -135,8 +169,17 @@ class SudokuCSP():
             var.lockDomainAsInitial()
 
     # Iterate over every constraint and get any variables constrained by this one
+    # The constraints never change once defined, so each variable's neighbors are only worked out once
     def getConstrainedNeighbors(self, variable):
-        return list(set([neighbor for c in self.constraints for neighbor in c.getConstrainedGroup(variable)]))
+        if variable.id not in self.neighbors:
+            self.neighbors[variable.id] = list(set([neighbor for c in self.constraints for neighbor in c.getConstrainedGroup(variable)]))
+        return self.neighbors[variable.id]
+
+    # The constraints this variable takes part in
+    def getVariableConstraints(self, variable):
+        if variable.id not in self.variable_constraints:
+            self.variable_constraints[variable.id] = [c for c in self.constraints if variable in c.variables]
+        return self.variable_constraints[variable.id]
 
     @ staticmethod
     def allDiff(variables):
@@ -1,25 +1,30 @@
-from classes.SudokuCSP import SudokuCSP
-from classes.MinimumRemainingValueSudokuCSP import MinimumRemainingValueSudokuCSP
-from classes.LeastConstrainingValueSudokuCSP import LeastConstrainingValueSudokuCSP
-from classes.ConflictDirectedBackjumpingSudokuCSP import ConflictDirectedBackjumpingSudokuCSP
+import importlib
 
 
 class SudokuCSPFactory():
     DEFAULT = 'def'
+    # Solvers are registered by module and class name, and only imported once they're asked for
     sudoku_csp_options = {
-        DEFAULT: SudokuCSP,
-        'mrv': MinimumRemainingValueSudokuCSP,
-        'lcv': LeastConstrainingValueSudokuCSP,
-        'cbg': ConflictDirectedBackjumpingSudokuCSP
+        DEFAULT: ('classes.SudokuCSP', 'SudokuCSP'),
+        'mrv': ('classes.MinimumRemainingValueSudokuCSP', 'MinimumRemainingValueSudokuCSP'),
+        'lcv': ('classes.LeastConstrainingValueSudokuCSP', 'LeastConstrainingValueSudokuCSP'),
+        'cbg': ('classes.ConflictDirectedBackjumpingSudokuCSP', 'ConflictDirectedBackjumpingSudokuCSP')
     }
 
+    @classmethod
+    def registerSudokuCSP(cls, ty, module_name, class_name):
+        cls.sudoku_csp_options[ty] = (module_name, class_name)
+
     @classmethod
     def getSudokuCSPOptions(cls):
         return list(cls.sudoku_csp_options.keys())
 
     @ classmethod
     def getSudokuCSP(cls, ty):
-        return cls.sudoku_csp_options.get(ty, f"No SudokuCSP of type {ty} available")
+        if ty not in cls.sudoku_csp_options:
+            return f"No SudokuCSP of type {ty} available"
+        (module_name, class_name) = cls.sudoku_csp_options[ty]
+        return getattr(importlib.import_module(module_name), class_name)
 
     @ classmethod
     def defaultSudokuCSPType(cls):
@@ -0,0 +1,145 @@
+from classes.SudokuCSPFactory import SudokuCSPFactory
+from classes.Logger import logger
+
+
+# A stateful puzzle for interactive use: givens are applied and retracted one cell at a time,
+# keeping domains up to date through each cell's peers, and the last solution is reused while it still fits
+class SudokuSession():
+    # MRV is the quickest of the solvers when a re-solve is needed
+    DEFAULT_SOLVER = 'mrv'
+    # Hint reasons
+    NAKED_SINGLE = "naked single"
+    HIDDEN_SINGLE = "hidden single"
+    SOLUTION = "solution"
+
+    def __init__(self, file_path=None, solver=DEFAULT_SOLVER, puzzle=None):
+        CspClass = SudokuCSPFactory.getSudokuCSP(solver)
+        if (type(CspClass) == str):
+            raise ValueError(CspClass)
+        self.csp = CspClass(file_path=file_path, puzzle=puzzle)
+        self.variables = self.csp.variables
+        self.full_domain = [x + 1 for x in range(0, self.csp.puzzle_size)]
+        # Every row, col and block as a list of cell indices, and every cell's peers, computed once up front
+        self.units = [[v.id for v in c.variables] for c in self.csp.constraints]
+        self.peers = [set() for _ in self.variables]
+        for unit in self.units:
+            for i in unit:
+                self.peers[i].update(unit)
+        for (i, peers) in enumerate(self.peers):
+            peers.discard(i)
+        self.solution = None
+
+    # Make a cell a given with this value, returning False if it clashes with a peer's given
+    def setCell(self, index, value):
+        self._checkIndex(index)
+        if value not in self.full_domain:
+            raise ValueError(f"{value} is not a valid value for a {self.csp.puzzle_size}x{self.csp.puzzle_size} puzzle")
+        variable = self.variables[index]
+        if variable.value == value:
+            return True
+        if variable.hasValue():
+            self.clearCell(index)
+        # Givens keep their full domain, like those the puzzle started with
+        variable.domain = self.full_domain.copy()
+        variable.lockDomainAsInitial()
+        variable.setValue(value)
+        for i in self.peers[index]:
+            peer = self.variables[i]
+            if not peer.hasValue() and peer.removeValueFromDomain(value):
+                peer.lockDomainAsInitial()
+        return not self._hasConflict(index)
+
+    # Retract a cell's given, giving its value back to any peers that nothing else rules it out for
+    def clearCell(self, index):
+        self._checkIndex(index)
+        variable = self.variables[index]
+        if not variable.hasValue():
+            return
+        value = variable.value
+        variable.resetValue()
+        self._refreshDomain(index)
+        for i in self.peers[index]:
+            if not self.variables[i].hasValue() and value not in self.variables[i].domain:
+                self._refreshDomain(i)
+
+    # Check whether the current givens can still be completed, re-validating the last solution before searching again
+    def isSolvable(self):
+        if any(self._hasConflict(i) for (i, v) in enumerate(self.variables) if v.hasValue()):
+            return False
+        if any(len(v.domain) == 0 for v in self.variables if not v.hasValue()):
+            return False
+        if self.solution is not None and self._solutionFits():
+            return True
+        # A failed search keeps the last solution around, as retracting the bad edit usually makes it fit again
+        solution = self._search()
+        if solution is None:
+            return False
+        self.solution = solution
+        return True
+
+    # Suggest the next cell to fill in, preferring deductions from the current domains over peeking at the solution
+    # Returns a dict of index, value and reason, or None if the puzzle is finished or unsolvable
+    def hint(self):
+        if not self.isSolvable():
+            return None
+        unassigned = [v for v in self.variables if not v.hasValue()]
+        if len(unassigned) == 0:
+            return None
+        for variable in unassigned:
+            if len(variable.domain) == 1:
+                return self._hint(variable.id, variable.domain[0], self.NAKED_SINGLE)
+        for unit in self.units:
+            for value in self.full_domain:
+                if any(self.variables[i].value == value for i in unit):
+                    continue
+                candidates = [i for i in unit if not self.variables[i].hasValue() and value in self.variables[i].domain]
+                if len(candidates) == 1:
+                    return self._hint(candidates[0], value, self.HIDDEN_SINGLE)
+        variable = min(unassigned, key=lambda var: len(var.domain))
+        return self._hint(variable.id, self.solution[variable.id], self.SOLUTION)
+
+    def _hint(self, index, value, reason):
+        return {"index": index, "value": value, "reason": reason}
+
+    # Negative indices would otherwise quietly edit cells counted from the end of the board
+    def _checkIndex(self, index):
+        if not (0 <= index < len(self.variables)):
+            raise IndexError(f"{index} is not a cell of a {self.csp.puzzle_size}x{self.csp.puzzle_size} puzzle")
+
+    def _hasConflict(self, index):
+        value = self.variables[index].value
+        return any(self.variables[i].value == value for i in self.peers[index])
+
+    def _solutionFits(self):
+        return all(v.value == self.solution[v.id] for v in self.variables if v.hasValue())
+
+    # Recompute an empty cell's domain from the values currently held by its peers
+    def _refreshDomain(self, index):
+        variable = self.variables[index]
+        taken = set(self.variables[i].value for i in self.peers[index])
+        variable.domain = [value for value in self.full_domain if value not in taken]
+        variable.lockDomainAsInitial()
+
+    # Run the solver from the current givens, then put the board back the way it was
+    def _search(self):
+        csp = self.csp
+        # The givens have changed since the solver was built, and isSolvable has already ruled out any clashes
+        csp.givens_consistent = True
+        assn = csp.solve()
+        solution = [v.value for v in self.variables] if assn != csp.FAILURE else None
+        touched = set()
+        for index in list(csp.assignment.keys()):
+            self.variables[index].resetValue()
+            touched.add(index)
+            touched.update(self.peers[index])
+        for index in touched:
+            if not self.variables[index].hasValue():
+                self._refreshDomain(index)
+        for variable in self.variables:
+            variable.conflict_set = []
+        if hasattr(csp, "conflict_set_variable_pointer"):
+            csp.conflict_set_variable_pointer = None
+        csp.assignment.clear()
+        csp.actions.clear()
+        logger.debug(f"Re-solved session puzzle, solvable: {solution is not None}")
+        return solution
@@ -1,17 +1,13 @@
-import uuid
-import logging
-import configparser
-
-# Config variables & logger
-config = configparser.ConfigParser()
-config.read('config/config.ini')
-LOGGER_NAME = config.get("LOGGER", "LOGGER_NAME")
-logger = logging.getLogger(LOGGER_NAME)
+from classes.Logger import logger
 
 
 class Variable():
     def __init__(self, value=None, id=None, domain=[]):
-        self.id = id if id is not None else uuid.uuid4()
+        if id is None:
+            # Puzzles always pass an id, so only pay for importing uuid when one is actually needed
+            import uuid
+            id = uuid.uuid4()
+        self.id = id
         self.value = value
         self.domain = domain.copy()
         self.initial_domain = domain.copy()
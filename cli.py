@@ -1,34 +1,33 @@
 import sys
 import time
 import argparse
-import configparser
 import logging
 import traceback
-# NOTE: Import here initializes our logger
-import classes.Logger
+from collections import deque
+from classes.Config import Config
+from classes.Logger import logger, setupLogging
 from classes.SudokuCSPFactory import SudokuCSPFactory
 from classes.PuzzleParser import PuzzleParser
-
-# Config variables & logger
-config = configparser.ConfigParser()
-config.read('config/config.ini')
-DEFAULT_PUZZLE = config.get("APP", "DEFAULT_PUZZLE")
-LOGGER_NAME = config.get("LOGGER", "LOGGER_NAME")
-logger = logging.getLogger(LOGGER_NAME)
+from classes.ResultWriter import ResultWriter
+from classes.ResultWriterFactory import ResultWriterFactory
+from classes.SolveJob import SolveJob
+from classes.PuzzleCorpus import PuzzleCorpus
 
 # Globals for cli
 START_TIME = time.time()
 
 
 def main():
+    setupLogging()
     parser = argparse.ArgumentParser(
         description='Solve Sudoku puzzles by modelling them as Constraint Satisfaction Problems using a number of CSP solver approaches'
     )
     parser.add_argument(
         "-p",
         "--puzzle_path",
-        default=DEFAULT_PUZZLE,
-        help="A path to a sudoku puzzle, represented in the format described in this project's README"
+        default=[Config.getPath("APP", "DEFAULT_PUZZLE")],
+        nargs="+",
+        help="One or more paths to sudoku puzzles, represented in the format described in this project's README"
     )
     parser.add_argument(
         "-d",
@@ -43,9 +42,58 @@ def main():
         default=SudokuCSPFactory.defaultSudokuCSPType(),
         help=f"The solver to use, options are: {SudokuCSPFactory.getSudokuCSPOptions()}; defaults to {SudokuCSPFactory.defaultSudokuCSPType()}"
     )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=None,
+        help="Stream results to this path ('-' for stdout) instead of logging each solution; defaults to logging"
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        default=ResultWriterFactory.defaultResultWriterType(),
+        choices=ResultWriterFactory.getResultWriterOptions(),
+        help=f"The format results are written in when using --output, options are: {ResultWriterFactory.getResultWriterOptions()}; defaults to {ResultWriterFactory.defaultResultWriterType()}"
+    )
+    parser.add_argument(
+        "-z",
+        "--compress",
+        default=None,
+        choices=ResultWriter.getCompressionOptions(),
+        help="Compress the --output stream; defaults to no compression"
+    )
+    parser.add_argument(
+        "-c",
+        "--corpus",
+        default=None,
+        help="Solve every puzzle in this binary corpus (see corpus.py) instead of --puzzle_path; results go to --output, or stdout"
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        default=1,
+        type=int,
+        help=f"The number of processes solving --corpus, each taking {Config.getInt('CORPUS', 'CHUNK_SIZE')} puzzles at a time; defaults to 1"
+    )
+    parser.add_argument(
+        "--profile",
+        default=False,
+        help="Solve the --puzzle_path puzzles logging how much time went to each phase of the search (variable selection, value ordering, consistency checks, domain bookkeeping and printing)",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--pstats",
+        default=None,
+        help="With --profile, also run the solves under cProfile and save the stats to this path, for use with pstats or snakeviz"
+    )
+    parser.add_argument(
+        "--collapsed",
+        default=None,
+        help="With --profile, also write the time spent in each stack of phases to this path as collapsed stacks, for flamegraph.pl or speedscope"
+    )
     args = parser.parse_args()
     logger.critical("Running solver")
-    logger.debug(f"With path: {args.puzzle_path}")
+    logger.debug(f"With paths: {args.puzzle_path}")
 
     # Parse the problem statement
     CspClass = SudokuCSPFactory.getSudokuCSP(args.solver)
@@ -53,7 +101,24 @@ def main():
         logger.error(CspClass)
         return
     logger.critical(f"Using Solver: {CspClass.__name__}")
-    csp = CspClass(args.puzzle_path, delay=args.delay)
+    if args.corpus is not None and args.output is None:
+        args.output = "-"
+    if args.profile:
+        profileSolves(args, CspClass)
+    elif args.output is not None:
+        WriterClass = ResultWriterFactory.getResultWriter(args.format)
+        if (type(WriterClass) == str):
+            logger.error(WriterClass)
+            return
+        writeResults(args, WriterClass)
+    else:
+        for puzzle_path in args.puzzle_path:
+            logResult(CspClass(puzzle_path, delay=args.delay))
+    logger.critical(f"--- RUNTIME:  {(time.time() - START_TIME)} seconds ---")
+
+
+# Solve a puzzle and log its solution, or the action history that led to failure
+def logResult(csp):
     assn = csp.solve()
     if (assn == csp.FAILURE):
         logger.critical("--- FAILURE: Could not find a valid assignment with the following action history")
@@ -63,7 +128,62 @@ def main():
         logger.critical("--- SUCCESS: Assignment is as follows")
         logger.critical(sorted(assn.items(), key=lambda key_value_tup: int(key_value_tup[0])))
         PuzzleParser.printPuzzle(csp, level=logging.CRITICAL)
-    logger.critical(f"--- RUNTIME:  {(time.time() - START_TIME)} seconds ---")
+
+
+# Solve each puzzle with its phases timed, logging the totals and writing any pstats or collapsed stack output
+def profileSolves(args, CspClass):
+    from classes.PhaseProfiler import PhaseProfiler
+    profiler = PhaseProfiler()
+    cprofile = None
+    if args.pstats is not None:
+        import cProfile
+        cprofile = cProfile.Profile()
+    for puzzle_path in args.puzzle_path:
+        csp = CspClass(puzzle_path, delay=args.delay)
+        if profiler.profile(csp, cprofile=cprofile) == csp.FAILURE:
+            logger.critical(f"--- FAILURE: Could not find a valid assignment for {puzzle_path}")
+    profiler.logReport()
+    if cprofile is not None:
+        cprofile.dump_stats(args.pstats)
+    if args.collapsed is not None:
+        with open(args.collapsed, "w") as collapsed:
+            collapsed.write("\n".join(profiler.collapsedStacks()) + "\n")
+
+
+# Solve each puzzle in turn, writing its result as soon as it is available so nothing accumulates in memory
+def writeResults(args, WriterClass):
+    with WriterClass(args.output, compression=args.compress) as writer:
+        if args.corpus is not None:
+            for results in solveCorpus(args):
+                for result in results:
+                    writer.write(result)
+        else:
+            for puzzle_path in args.puzzle_path:
+                puzzle = PuzzleParser.parsePuzzle(puzzle_path)
+                writer.write(SolveJob.run(args.solver, puzzle, job_id=puzzle_path, delay=args.delay))
+
+
+# Solve a corpus in chunks of CHUNK_SIZE puzzles, yielding each chunk's results in corpus order
+# Workers are only told the index range to solve; they map the corpus file themselves
+def solveCorpus(args):
+    chunk_size = Config.getInt("CORPUS", "CHUNK_SIZE")
+    with PuzzleCorpus(args.corpus) as corpus:
+        count = len(corpus)
+    ranges = [(start, min(start + chunk_size, count)) for start in range(0, count, chunk_size)]
+    if args.workers <= 1:
+        for (start, stop) in ranges:
+            yield SolveJob.runCorpusRange(args.solver, args.corpus, start, stop, delay=args.delay)
+        return
+    # Only keep a couple of chunks per worker in flight, so finished results can't pile up ahead of the writer
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        pending = deque()
+        for (start, stop) in ranges:
+            pending.append(executor.submit(SolveJob.runCorpusRange, args.solver, args.corpus, start, stop, args.delay))
+            if len(pending) >= 2 * args.workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,28 @@
+import argparse
+from classes.Logger import setupLogging
+from classes.PuzzleCorpus import PuzzleCorpus
+
+
+def main():
+    setupLogging()
+    parser = argparse.ArgumentParser(
+        description='Convert sudoku puzzles from the text format into a single binary corpus, for fast batch solving'
+    )
+    parser.add_argument(
+        "puzzle_paths",
+        nargs="+",
+        help="Paths to sudoku puzzles in the text format, all of the same size"
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        required=True,
+        help="The path of the corpus file to write"
+    )
+    args = parser.parse_args()
+    count = PuzzleCorpus.convert(args.puzzle_paths, args.output)
+    print(f"Wrote {count} puzzles to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+import os
+import argparse
+from classes.Config import Config
+from classes.Logger import setupLogging
+from classes.PuzzleParser import PuzzleParser
+from classes.PuzzleGenerator import PuzzleGenerator
+from classes.SudokuCSPFactory import SudokuCSPFactory
+
+
+def main():
+    setupLogging()
+    parser = argparse.ArgumentParser(
+        description='Generate sudoku puzzles with unique solutions, sorted into easy, hard and evil sets by how hard they are to solve'
+    )
+    parser.add_argument(
+        "--size",
+        type=int,
+        default=9,
+        help="The puzzle size, a square number such as 9, 16 or 25"
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Seed for the generator; the same seed always generates the same puzzles"
+    )
+    parser.add_argument(
+        "--count",
+        type=int,
+        default=1,
+        help="How many puzzles to generate for each difficulty"
+    )
+    parser.add_argument(
+        "--out-dir",
+        default=Config.getPath("GENERATOR", "OUT_DIR"),
+        help="Puzzles are written to <out-dir>/<size>/<difficulty>/<seed>-<n>.txt"
+    )
+    parser.add_argument(
+        "--min-givens",
+        type=int,
+        default=0,
+        help="Stop removing cells once this many givens are left"
+    )
+    parser.add_argument(
+        "--max-attempts",
+        type=int,
+        default=100,
+        help="Give up after generating this many puzzles, even if some difficulties aren't filled"
+    )
+    parser.add_argument(
+        "-s",
+        "--solver",
+        default=None,
+        choices=SudokuCSPFactory.getSudokuCSPOptions(),
+        help="The solver used to check uniqueness and rate difficulty, REFERENCE_SOLVER in the config by default"
+    )
+    args = parser.parse_args()
+    generator = PuzzleGenerator(args.size, seed=args.seed, solver=args.solver)
+    sets = generator.generateSets(args.count, min_givens=args.min_givens, max_attempts=args.max_attempts)
+    for (difficulty, puzzles) in sets.items():
+        directory = os.path.join(args.out_dir, str(args.size), difficulty)
+        os.makedirs(directory, exist_ok=True)
+        for (n, puzzle) in enumerate(puzzles):
+            path = os.path.join(directory, f"{args.seed}-{n}.txt")
+            with open(path, "w") as puzzle_file:
+                puzzle_file.write(PuzzleParser.formatPuzzle(puzzle["puzzle_size"], puzzle["values"]))
+            print(f"Wrote {difficulty} puzzle with {puzzle['givens']} givens to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import asyncio
+import argparse
+from classes.Config import Config
+from classes.Logger import setupLogging
+from classes.SolveService import SolveService
+
+
+def main():
+    setupLogging()
+    default_host = Config.get("SERVICE", "HOST")
+    default_port = Config.getInt("SERVICE", "PORT")
+    default_workers = Config.getInt("SERVICE", "WORKERS")
+    default_queue_limit = Config.getInt("SERVICE", "QUEUE_LIMIT")
+    default_batch_size = Config.getInt("SERVICE", "BATCH_SIZE")
+    default_request_timeout = Config.getFloat("SERVICE", "REQUEST_TIMEOUT")
+    parser = argparse.ArgumentParser(
+        description='Run a long-lived local service that solves Sudoku puzzles on a pool of warm solver processes'
+    )
+    parser.add_argument("--host", default=default_host, help=f"The address to listen on; defaults to {default_host}")
+    parser.add_argument("--port", default=default_port, type=int, help=f"The port to listen on, 0 picks a free one; defaults to {default_port}")
+    parser.add_argument("-w", "--workers", default=default_workers, type=int, help=f"The number of solver processes; defaults to {default_workers}")
+    parser.add_argument("-q", "--queue_limit", default=default_queue_limit, type=int, help=f"The number of queued puzzles before requests are rejected; defaults to {default_queue_limit}")
+    parser.add_argument("-b", "--batch_size", default=default_batch_size, type=int, help=f"The most puzzles sent to a worker at once; defaults to {default_batch_size}")
+    parser.add_argument("-t", "--timeout", default=default_request_timeout, type=float, help=f"The default per-request timeout, in seconds; defaults to {default_request_timeout}")
+    args = parser.parse_args()
+
+    service = SolveService(
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        queue_limit=args.queue_limit,
+        batch_size=args.batch_size,
+        request_timeout=args.timeout
+    )
+    try:
+        asyncio.run(service.serveForever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+import unittest
+import tracemalloc
+from classes.Logger import setupLogging
+from classes.MemoryProfiler import MemoryProfiler, SITES
+
+# Initialize our logger
+setupLogging()
+
+# global test fixture paths
+half_finished_path = "tests/fixtures/half_finished.txt"
+easy_path = "data/easy.txt"
+
+
+class MemoryProfilerTest(unittest.TestCase):
+    def test_profile_puzzle(self):
+        result = MemoryProfiler().profilePuzzle("mrv", easy_path)
+        self.assertEqual(result["status"], "solved")
+        self.assertEqual(result["puzzle_size"], 9)
+        self.assertGreater(result["retained"], 0)
+        self.assertGreaterEqual(result["peak"], result["retained"])
+        self.assertEqual(list(result["sites"].keys()), SITES)
+        # Every solver keeps its variables, constraints, neighbors, trail and action history around
+        for site in ["variables", "constraints", "neighbors", "trail", "history"]:
+            self.assertGreater(result["sites"][site], 0)
+        self.assertLessEqual(sum(result["sites"].values()), result["peak"])
+        # Tracing is left the way it was found
+        self.assertFalse(tracemalloc.is_tracing())
+
+    def test_history_grows_with_search(self):
+        # The default solver backtracks far more than MRV on the same puzzle, and keeps every step in its history
+        profiler = MemoryProfiler()
+        basic = profiler.profilePuzzle("def", easy_path)
+        mrv = profiler.profilePuzzle("mrv", easy_path)
+        self.assertGreater(basic["sites"]["history"], mrv["sites"]["history"])
+
+    def test_profile_summary(self):
+        report = MemoryProfiler(solvers=["def", "mrv"]).profile([half_finished_path, easy_path])
+        self.assertEqual(len(report["puzzles"]), 4)
+        self.assertEqual(sorted(report["sizes"].keys()), ["4", "9"])
+        summary = report["sizes"]["9"]["mrv"]
+        self.assertEqual(summary["puzzles"], 1)
+        self.assertEqual(summary["peak_max"], summary["peak_average"])
+
+    def test_unknown_solver(self):
+        with self.assertRaises(ValueError):
+            MemoryProfiler().profilePuzzle("nope", easy_path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import cProfile
+import pstats
+import unittest
+from classes.Logger import setupLogging
+from classes.PhaseProfiler import PhaseProfiler, PHASES
+from classes.PuzzleParser import PuzzleParser
+from classes.SudokuCSP import SudokuCSP
+from classes.SudokuCSPFactory import SudokuCSPFactory
+
+# Initialize our logger
+setupLogging()
+
+# global test fixture paths
+half_finished_path = "tests/fixtures/half_finished.txt"
+
+
+class PhaseProfilerTest(unittest.TestCase):
+    def test_every_solver(self):
+        profiler = PhaseProfiler()
+        for option in SudokuCSPFactory.getSudokuCSPOptions():
+            CspClass = SudokuCSPFactory.getSudokuCSP(option)
+            csp = CspClass(file_path=half_finished_path)
+            self.assertIsNot(profiler.profile(csp), csp.FAILURE)
+            self.assertEqual(csp.goalTest(), True)
+        report = profiler.report()
+        self.assertEqual(len(report), len(SudokuCSPFactory.getSudokuCSPOptions()))
+        for phases in report.values():
+            self.assertEqual(list(phases.keys()), PHASES)
+            self.assertEqual(phases["solve"]["calls"], 1)
+            # Everything happens within the solve, and time spent in nested phases isn't counted twice
+            nested = sum(stats["exclusive"] for (phase, stats) in phases.items() if phase != "solve")
+            self.assertAlmostEqual(phases["solve"]["cumulative"], phases["solve"]["exclusive"] + nested)
+            for stats in phases.values():
+                self.assertGreater(stats["calls"], 0)
+                self.assertGreaterEqual(stats["cumulative"], stats["exclusive"])
+
+    def test_detaches(self):
+        csp = SudokuCSP(file_path=half_finished_path)
+        print_puzzle = PuzzleParser.__dict__["printPuzzle"]
+        PhaseProfiler().profile(csp)
+        self.assertEqual([phase for phase in PHASES if phase in csp.__dict__], [])
+        self.assertTrue(all(c.constraint_fn is SudokuCSP.allDiff for c in csp.constraints))
+        self.assertIs(PuzzleParser.__dict__["printPuzzle"], print_puzzle)
+
+    def test_collapsed_stacks_and_pstats(self):
+        profiler = PhaseProfiler()
+        cprofile = cProfile.Profile()
+        profiler.profile(SudokuCSP(file_path=half_finished_path), cprofile=cprofile)
+        stacks = dict(line.rsplit(" ", 1) for line in profiler.collapsedStacks())
+        self.assertIn("SudokuCSP;solve;isAssignmentConsistent;allDiff", stacks)
+        self.assertIn("SudokuCSP;solve;isAssignmentConsistent;assignVariable", stacks)
+        self.assertTrue(all(microseconds.isdigit() for microseconds in stacks.values()))
+        functions = [function for (_, _, function) in pstats.Stats(cprofile).stats.keys()]
+        self.assertIn("isAssignmentConsistent", functions)
+
+
+if __name__ == "__main__":
+    unittest.main()
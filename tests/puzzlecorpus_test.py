@@ -0,0 +1,79 @@
+import gc
+import os
+import tempfile
+import unittest
+import warnings
+from classes.Logger import setupLogging
+from classes.PuzzleCorpus import PuzzleCorpus
+from classes.PuzzleParser import PuzzleParser
+from classes.SudokuCSP import SudokuCSP
+from classes.SolveJob import SolveJob
+
+# Initialize our logger
+setupLogging()
+
+# global test fixture paths
+one_missing_path = "tests/fixtures/1_missing.txt"
+finished_path = "tests/fixtures/finished.txt"
+half_finished_path = "tests/fixtures/half_finished.txt"
+easy_path = "data/easy.txt"
+
+
+class PuzzleCorpusTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.corpus_path = os.path.join(self.directory.name, "corpus.sdkc")
+        self.puzzle_paths = [one_missing_path, finished_path, half_finished_path]
+        PuzzleCorpus.convert(self.puzzle_paths, self.corpus_path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        with PuzzleCorpus(self.corpus_path) as corpus:
+            self.assertEqual(len(corpus), 3)
+            self.assertEqual(corpus.puzzle_size, 4)
+            for (i, puzzle_path) in enumerate(self.puzzle_paths):
+                (_, values) = PuzzleParser.parsePuzzle(puzzle_path)
+                with corpus.cells(i) as cells:
+                    self.assertEqual([v or None for v in cells], values)
+
+    def test_cell_range(self):
+        with PuzzleCorpus(self.corpus_path) as corpus:
+            with corpus.cellRange(1, 3) as cells:
+                self.assertEqual(len(cells), 2 * 16)
+                self.assertEqual(cells[16:].tobytes(), corpus.cells(2).tobytes())
+            with corpus.cellRange(2, 2) as cells:
+                self.assertEqual(len(cells), 0)
+
+    def test_solvers_accept_views(self):
+        with PuzzleCorpus(self.corpus_path) as corpus:
+            from_corpus = SudokuCSP(puzzle=corpus.puzzle(2))
+            from_text = SudokuCSP(file_path=half_finished_path)
+            self.assertEqual([v.value for v in from_corpus.variables], [v.value for v in from_text.variables])
+            self.assertEqual([v.domain for v in from_corpus.variables], [v.domain for v in from_text.variables])
+        results = SolveJob.runCorpusRange("mrv", self.corpus_path, 0, 10)
+        self.assertEqual([r["id"] for r in results], [0, 1, 2])
+        self.assertEqual([r["status"] for r in results], ["solved"] * 3)
+
+    def test_invalid_corpora(self):
+        mixed_path = os.path.join(self.directory.name, "mixed.sdkc")
+        with self.assertRaises(ValueError):
+            PuzzleCorpus.convert([half_finished_path, easy_path], mixed_path)
+        with self.assertRaises(ValueError):
+            PuzzleCorpus(half_finished_path)
+        # Empty files and truncated headers are rejected the same way, closing the file behind them
+        for (name, contents) in [("empty.sdkc", b""), ("short.sdkc", b"SDKC\x01")]:
+            path = os.path.join(self.directory.name, name)
+            with open(path, "wb") as corpus:
+                corpus.write(contents)
+            with warnings.catch_warnings(record=True) as caught:
+                warnings.simplefilter("always", ResourceWarning)
+                with self.assertRaisesRegex(ValueError, "not a version 1 puzzle corpus"):
+                    PuzzleCorpus(path)
+                gc.collect()
+            self.assertEqual([w for w in caught if issubclass(w.category, ResourceWarning)], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
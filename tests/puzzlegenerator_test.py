@@ -0,0 +1,78 @@
+import unittest
+from classes.Config import Config
+from classes.Logger import setupLogging
+from classes.SolveJob import SolveJob
+from classes.SudokuCSP import SudokuCSP
+from classes.PuzzleGenerator import PuzzleGenerator
+
+# Initialize our logger
+setupLogging()
+
+
+class PuzzleGeneratorTest(unittest.TestCase):
+    def test_solved_grid(self):
+        for size in [4, 9, 16]:
+            grid = PuzzleGenerator(size, seed=0).solvedGrid()
+            csp = SudokuCSP(puzzle=(size, grid))
+            self.assertEqual(csp.unassignedVariables(), [])
+            self.assertEqual(csp.allConstraintsSatisfied(), True)
+
+    def test_generated_puzzles_are_unique(self):
+        generator = PuzzleGenerator(9, seed=1)
+        puzzle = generator.generate()
+        csp = generator.CspClass(puzzle=(9, puzzle["values"]))
+        self.assertEqual(csp.countSolutions(limit=2), 1)
+        # The givens agree with the solution the puzzle was carved out of
+        self.assertTrue(all(v is None or v == s for (v, s) in zip(puzzle["values"], puzzle["solution"])))
+        self.assertEqual(puzzle["givens"], sum(1 for v in puzzle["values"] if v is not None))
+
+    def test_same_seed_same_puzzle(self):
+        self.assertEqual(PuzzleGenerator(9, seed=2).generate(), PuzzleGenerator(9, seed=2).generate())
+        self.assertNotEqual(PuzzleGenerator(9, seed=2).generate(), PuzzleGenerator(9, seed=3).generate())
+
+    def test_rating_follows_thresholds(self):
+        easy_max = Config.getFloat("GENERATOR", "EASY_MAX_BACKTRACK_RATIO")
+        hard_max = Config.getFloat("GENERATOR", "HARD_MAX_BACKTRACK_RATIO")
+        generator = PuzzleGenerator(9, seed=4)
+        self.assertEqual(generator.threshold("HARD_MAX_BACKTRACK_RATIO"), hard_max)
+        for puzzle in [generator.generate() for _ in range(4)]:
+            result = SolveJob.run(generator.solver, (9, puzzle["values"]))
+            ratio = result["backtracks"] / (81 - puzzle["givens"])
+            expected = PuzzleGenerator.EASY if ratio <= easy_max else (PuzzleGenerator.HARD if ratio <= hard_max else PuzzleGenerator.EVIL)
+            self.assertEqual(puzzle["difficulty"], expected)
+            self.assertEqual(puzzle["backtracks"], result["backtracks"])
+
+    def test_sized_thresholds(self):
+        # 25x25 puzzles have their own hard/evil boundary, and fall back to the shared easy one
+        generator = PuzzleGenerator(25, seed=0)
+        self.assertEqual(generator.threshold("HARD_MAX_BACKTRACK_RATIO"), Config.getFloat("GENERATOR", "HARD_MAX_BACKTRACK_RATIO_25"))
+        self.assertEqual(generator.threshold("EASY_MAX_BACKTRACK_RATIO"), Config.getFloat("GENERATOR", "EASY_MAX_BACKTRACK_RATIO"))
+
+    def test_generate_sets(self):
+        sets = PuzzleGenerator(4, seed=0).generateSets(1, max_attempts=5)
+        self.assertEqual(list(sets.keys()), PuzzleGenerator.DIFFICULTIES)
+        self.assertTrue(all(puzzle["difficulty"] == difficulty for (difficulty, puzzles) in sets.items() for puzzle in puzzles))
+        self.assertTrue(all(len(puzzles) <= 1 for puzzles in sets.values()))
+
+    def test_16x16_finishes(self):
+        # Uniqueness checks are capped by MAX_SEARCH_NODES, so larger puzzles finish in a few seconds
+        generator = PuzzleGenerator(16, seed=1)
+        puzzle = generator.generate()
+        csp = generator.CspClass(puzzle=(16, puzzle["values"]))
+        self.assertEqual(csp.countSolutions(limit=2, max_nodes=Config.getInt("GENERATOR", "MAX_SEARCH_NODES")), 1)
+        self.assertLess(puzzle["givens"], 16 * 16)
+
+    def test_count_solutions_cap(self):
+        # An empty board has far more solutions than a few nodes can find, so the count is unknown
+        csp = SudokuCSP(puzzle=(9, [None] * 81))
+        self.assertEqual(csp.countSolutions(limit=2, max_nodes=10), None)
+        self.assertEqual(csp.unassignedVariables(), csp.variables)
+        self.assertEqual(csp.actions, [])
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            PuzzleGenerator(10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+import os
+import json
+import gzip
+import tempfile
+import unittest
+from classes.Logger import setupLogging
+from classes.SolveJob import SolveJob
+from classes.PuzzleParser import PuzzleParser
+from classes.ResultWriterFactory import ResultWriterFactory
+from classes.ResultWriter import ResultWriter
+from classes.BinaryResultWriter import BinaryResultWriter
+
+# Initialize our logger
+setupLogging()
+
+# global test fixture paths
+half_finished_path = "tests/fixtures/half_finished.txt"
+invalid_path = "tests/fixtures/invalid.txt"
+
+
+class ResultWriterTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.solved = SolveJob.run("def", PuzzleParser.parsePuzzle(half_finished_path), job_id=half_finished_path)
+        self.failed = SolveJob.run("def", PuzzleParser.parsePuzzle(invalid_path), job_id=invalid_path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def outputPath(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_solution_writer(self):
+        path = self.outputPath("solutions.txt")
+        with ResultWriterFactory.getResultWriter("solution")(path) as writer:
+            writer.write(self.solved)
+            writer.write(self.failed)
+        with open(path) as solutions:
+            lines = solutions.read().splitlines()
+        self.assertEqual(lines, [PuzzleParser.toCompactString(self.solved["values"]), "failed"])
+        self.assertEqual(len(lines[0]), 16)
+
+    def test_json_lines_writer(self):
+        path = self.outputPath("results.jsonl.gz")
+        with ResultWriterFactory.getResultWriter("jsonl")(path, compression="gzip") as writer:
+            writer.write(self.solved)
+            writer.write(self.failed)
+        with gzip.open(path, "rt") as results:
+            records = [json.loads(line) for line in results]
+        self.assertEqual([r["id"] for r in records], [half_finished_path, invalid_path])
+        self.assertEqual(records[0]["solution"], PuzzleParser.toCompactString(self.solved["values"]))
+        self.assertEqual(records[0]["assignments"], self.solved["assignments"])
+        self.assertEqual(records[1]["solution"], None)
+
+    def test_binary_writer_appends(self):
+        path = self.outputPath("results.bin")
+        # Each writer appends to whatever the previous ones wrote
+        for result in [self.solved, self.failed]:
+            with ResultWriterFactory.getResultWriter("binary")(path) as writer:
+                writer.write(result)
+        records = list(BinaryResultWriter.readResults(path))
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[0]["values"], self.solved["values"])
+        self.assertEqual(records[0]["backtracks"], self.solved["backtracks"])
+        self.assertEqual(records[1]["status"], "failed")
+        self.assertEqual(records[1]["values"], None)
+
+    def test_unknown_options(self):
+        self.assertEqual(type(ResultWriterFactory.getResultWriter("xml")), str)
+        with self.assertRaises(ValueError):
+            ResultWriterFactory.getResultWriter("jsonl")(self.outputPath("x"), compression="zip")
+        # The base class leaves encoding to its subclasses
+        with self.assertRaises(TypeError):
+            ResultWriter(self.outputPath("y"))
+
+
+if __name__ == "__main__":
+    unittest.main()
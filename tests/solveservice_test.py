@@ -0,0 +1,122 @@
+import json
+import asyncio
+import unittest
+from pathlib import Path
+from classes.Logger import setupLogging
+from classes.SolveService import SolveService
+
+# Initialize our logger
+setupLogging()
+
+# global test fixture paths
+half_finished_path = "tests/fixtures/half_finished.txt"
+invalid_path = "tests/fixtures/invalid.txt"
+hard_path = "data/hard.txt"
+
+
+# Send a single HTTP request to the service on localhost, returning the status code and decoded JSON body
+async def request(port, method, path, payload=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = json.dumps(payload).encode() if payload is not None else b""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    (head, response_body) = response.split(b"\r\n\r\n", 1)
+    status = int(head.split(b" ")[1])
+    return (status, json.loads(response_body))
+
+
+def newService(**kwargs):
+    options = dict(host="127.0.0.1", port=0, workers=1, queue_limit=8, batch_size=4, request_timeout=30)
+    options.update(kwargs)
+    return SolveService(**options)
+
+
+class SolveServiceTest(unittest.TestCase):
+    def test_solve(self):
+        async def scenario():
+            service = newService()
+            await service.start()
+            try:
+                puzzle = Path(half_finished_path).read_text()
+                (status, result) = await request(service.port, "POST", "/solve", {"puzzle": puzzle, "solver": "mrv"})
+                self.assertEqual(status, 200)
+                self.assertEqual(result["status"], "solved")
+                self.assertEqual(result["puzzle_size"], 4)
+                self.assertNotIn(None, result["values"])
+                # Batches come back in the order they were sent
+                invalid = Path(invalid_path).read_text()
+                (status, result) = await request(service.port, "POST", "/solve", {"puzzles": [puzzle, invalid]})
+                self.assertEqual(status, 200)
+                self.assertEqual([r["status"] for r in result["results"]], ["solved", "failed"])
+                # Garbage puzzles are reported as errors rather than taking the service down
+                (status, result) = await request(service.port, "POST", "/solve", {"puzzle": "2\nx,y\n"})
+                self.assertEqual(result["status"], "error")
+                (status, metrics) = await request(service.port, "GET", "/metrics")
+                self.assertEqual(status, 200)
+                self.assertEqual(metrics["completed"], 2)
+                self.assertEqual(metrics["failed"], 1)
+                self.assertEqual(metrics["errors"], 1)
+                self.assertEqual(metrics["queue_depth"], 0)
+                self.assertEqual(sum(metrics["latency"]["histogram"].values()), 4)
+            finally:
+                await service.stop()
+        asyncio.run(scenario())
+
+    def test_bad_requests(self):
+        async def scenario():
+            service = newService()
+            await service.start()
+            try:
+                (status, _) = await request(service.port, "POST", "/solve", {"puzzle": "4\n", "solver": "nope"})
+                self.assertEqual(status, 400)
+                (status, _) = await request(service.port, "POST", "/solve", {})
+                self.assertEqual(status, 400)
+                (status, _) = await request(service.port, "GET", "/solve")
+                self.assertEqual(status, 405)
+                (status, _) = await request(service.port, "GET", "/elsewhere")
+                self.assertEqual(status, 404)
+                # A string isn't a list of puzzles, and a batch bigger than the queue could never be accepted
+                (status, _) = await request(service.port, "POST", "/solve", {"puzzles": "4\n"})
+                self.assertEqual(status, 400)
+                (status, _) = await request(service.port, "POST", "/solve", {"puzzles": ["4\n"] * 9})
+                self.assertEqual(status, 413)
+                # Oversized and non-square puzzles are turned away before they're parsed
+                for puzzle in ["8000\n", "100000\n", "10\n", "0\n"]:
+                    (status, result) = await request(service.port, "POST", "/solve", {"puzzle": puzzle})
+                    self.assertEqual(status, 200)
+                    self.assertEqual(result["status"], "error")
+                    self.assertIn("Puzzle size", result["error"])
+            finally:
+                await service.stop()
+        asyncio.run(scenario())
+
+    def test_back_pressure_and_timeouts(self):
+        async def scenario():
+            service = newService(queue_limit=2, batch_size=1)
+            await service.start()
+            try:
+                hard = Path(hard_path).read_text()
+                # The worker takes the first puzzle, leaving the second queued
+                slow = asyncio.ensure_future(request(service.port, "POST", "/solve", {"puzzles": [hard, hard], "timeout": 0.1}))
+                await asyncio.sleep(0.05)
+                # So there's only room for one more puzzle, and a pair is rejected
+                (status, _) = await request(service.port, "POST", "/solve", {"puzzles": [hard, hard]})
+                self.assertEqual(status, 503)
+                (status, _) = await slow
+                self.assertEqual(status, 504)
+                # Let the worker finish the puzzle it was given; its result mustn't count as well as the timeout
+                while service.in_flight > 0:
+                    await asyncio.sleep(0.05)
+                (_, metrics) = await request(service.port, "GET", "/metrics")
+                self.assertEqual(metrics["rejected"], 2)
+                self.assertEqual(metrics["timed_out"], 2)
+                self.assertEqual(metrics["completed"] + metrics["failed"] + metrics["errors"], 0)
+                self.assertEqual(sum(metrics["latency"]["histogram"].values()), 0)
+            finally:
+                await service.stop()
+        asyncio.run(scenario())
+
+if __name__ == "__main__":
+    unittest.main()
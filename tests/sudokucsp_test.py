@@ -1,9 +1,11 @@
 import unittest
-# NOTE: Import here initializes our logger
-import classes.Logger
+from classes.Logger import setupLogging
 from classes.SudokuCSP import SudokuCSP
 from classes.PuzzleParser import PuzzleParser
 
+# Initialize our logger
+setupLogging()
+
 # global test fixture paths
 one_missing_path = "tests/fixtures/1_missing.txt"
 finished_path = "tests/fixtures/finished.txt"
@@ -131,6 +133,17 @@ class SudokuCSPTest(unittest.TestCase):
         self.assertEqual(is_consistent, True)
         # TODO: write a check in the negative case
 
+    def test_invalid_givens_rejected(self):
+        # Only the variable's own constraints are checked per assignment, but clashing givens elsewhere still rule out every value
+        # Here the two 2s in the last row share no row, col or block with the blank cell
+        invalid = SudokuCSP(puzzle=(4, [None, 2, 3, 4, 3, 4, 1, 2, 2, 1, 4, 3, 4, 3, 2, 2]))
+        unassigned_variable = invalid.getUnassignedVariable()
+        for value in range(1, invalid.puzzle_size + 1):
+            self.assertEqual(invalid.isAssignmentConsistent(unassigned_variable, value), False)
+        # So the search gives up at the first variable instead of running through the whole tree
+        self.assertEqual(invalid.solve(), invalid.FAILURE)
+        self.assertEqual(invalid.actions, [])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+from classes.Logger import setupLogging
+from classes.SudokuSession import SudokuSession
+from classes.SudokuCSP import SudokuCSP
+from classes.PuzzleParser import PuzzleParser
+
+# Initialize our logger
+setupLogging()
+
+# global test fixture paths
+half_finished_path = "tests/fixtures/half_finished.txt"
+easy_path = "data/easy.txt"
+
+
+class SudokuSessionTest(unittest.TestCase):
+    # Domains after incremental edits should match those of a puzzle built from scratch with the same givens
+    def assertDomainsMatchFreshPuzzle(self, session):
+        values = [v.value for v in session.variables]
+        fresh = SudokuCSP(puzzle=(session.csp.puzzle_size, values))
+        for (variable, fresh_variable) in zip(session.variables, fresh.variables):
+            if not variable.hasValue():
+                self.assertEqual(sorted(variable.domain), sorted(fresh_variable.domain))
+
+    def test_edits_update_domains(self):
+        session = SudokuSession(file_path=easy_path)
+        empty = [v.id for v in session.variables if not v.hasValue()]
+        session.setCell(empty[0], session.variables[empty[0]].domain[0])
+        self.assertDomainsMatchFreshPuzzle(session)
+        session.setCell(empty[5], session.variables[empty[5]].domain[-1])
+        self.assertDomainsMatchFreshPuzzle(session)
+        session.clearCell(empty[0])
+        self.assertDomainsMatchFreshPuzzle(session)
+        # Clearing a cell the puzzle started with works the same way
+        given = [v.id for v in session.variables if v.hasValue()][0]
+        session.clearCell(given)
+        self.assertDomainsMatchFreshPuzzle(session)
+
+    def test_is_solvable(self):
+        session = SudokuSession(file_path=easy_path)
+        self.assertTrue(session.isSolvable())
+        solution = session.solution
+        self.assertNotIn(None, solution)
+        # The search should leave the board as it found it
+        self.assertEqual([v.value for v in session.variables], PuzzleParser.parsePuzzle(easy_path)[1])
+        self.assertDomainsMatchFreshPuzzle(session)
+        # Agreeing with the last solution reuses it
+        empty = [v.id for v in session.variables if not v.hasValue()][0]
+        self.assertTrue(session.setCell(empty, solution[empty]))
+        self.assertTrue(session.isSolvable())
+        self.assertIs(session.solution, solution)
+        # Clashing with a peer's given makes the puzzle unsolvable, until the edit is retracted
+        clash = [session.variables[i].value for i in session.peers[empty] if session.variables[i].hasValue()][0]
+        self.assertFalse(session.setCell(empty, clash))
+        self.assertFalse(session.isSolvable())
+        session.clearCell(empty)
+        self.assertTrue(session.isSolvable())
+
+    def test_wrong_but_consistent_edit(self):
+        session = SudokuSession(file_path=half_finished_path)
+        self.assertTrue(session.isSolvable())
+        solution = session.solution
+        empty = [v for v in session.variables if not v.hasValue() and len(v.domain) > 1][0]
+        other_value = [value for value in empty.domain if value != solution[empty.id]][0]
+        session.setCell(empty.id, other_value)
+        # half_finished has a unique solution, so any other value leaves it unsolvable
+        self.assertFalse(session.isSolvable())
+        self.assertIsNone(session.hint())
+        # The failed search keeps the old solution, so fixing the edit reuses it instead of searching again
+        self.assertIs(session.solution, solution)
+        session.setCell(empty.id, solution[empty.id])
+        self.assertTrue(session.isSolvable())
+        self.assertIs(session.solution, solution)
+
+    def test_out_of_range_cells(self):
+        session = SudokuSession(file_path=half_finished_path)
+        for index in [-1, len(session.variables)]:
+            with self.assertRaises(IndexError):
+                session.setCell(index, 1)
+            with self.assertRaises(IndexError):
+                session.clearCell(index)
+
+    def test_hint(self):
+        session = SudokuSession(file_path=easy_path)
+        self.assertTrue(session.isSolvable())
+        solution = session.solution
+        # Following hints all the way should complete the puzzle
+        hint = session.hint()
+        while hint is not None:
+            self.assertEqual(hint["value"], solution[hint["index"]])
+            session.setCell(hint["index"], hint["value"])
+            hint = session.hint()
+        self.assertEqual([v.value for v in session.variables], solution)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            SudokuSession(file_path=easy_path, solver="nope")
+        session = SudokuSession(file_path=easy_path)
+        with self.assertRaises(ValueError):
+            session.setCell(0, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
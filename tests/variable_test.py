@@ -1,8 +1,10 @@
 import unittest
-# NOTE: Import here initializes our logger
-import classes.Logger
+from classes.Logger import setupLogging
 from classes.Variable import Variable
 
+# Initialize our logger
+setupLogging()
+
 
 class VariableTest(unittest.TestCase):
     def test_has_value(self):
@@ -1,12 +1,87 @@
-import cli
+import sys
+import json
+import time
 import timeit
-import configparser
+import argparse
+import subprocess
+from classes.Config import ROOT_PATH, Config
+
+# Imports cli in a fresh interpreter, printing how long the import alone took
+IMPORT_SNIPPET = "import time; start = time.perf_counter(); import cli; print(time.perf_counter() - start)"
+
+
+# For short jobs, starting the process costs more than solving, so time both a bare interpreter start and importing the cli
+def measureStartup(runs):
+    startup_times = []
+    import_times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        output = subprocess.run([sys.executable, "-c", IMPORT_SNIPPET], cwd=ROOT_PATH, check=True, capture_output=True, text=True).stdout
+        startup_times.append(time.perf_counter() - start)
+        import_times.append(float(output))
+    return {
+        "startup_average": sum(startup_times) / runs,
+        "import_average": sum(import_times) / runs,
+    }
+
+
+# Time the cli itself, which parses whatever arguments weren't meant for us
+def measureSolve(runs, cli_args):
+    import cli
+    sys.argv = [sys.argv[0]] + cli_args
+    t = timeit.timeit("cli.main()", globals={"cli": cli}, number=runs)
+    return {"average": t / float(runs)}
+
+
+# Peak and retained memory for each solver on each puzzle, broken down by where the retained memory was allocated
+def measureMemory(puzzle_paths=None, solvers=None):
+    from classes.MemoryProfiler import MemoryProfiler
+    if puzzle_paths is None:
+        data_path = ROOT_PATH / "data"
+        puzzle_paths = sorted(data_path.glob("*.txt")) + sorted(data_path.glob("*/easy/*.txt"))
+    return MemoryProfiler(solvers=solvers).profile(puzzle_paths)
 
-# Config variables & logger
-config = configparser.ConfigParser()
-config.read('config/config.ini')
-RUNS = int(config.get("BENCHMARKING", "RUNS"))
 
 if __name__ == "__main__":
-    t = timeit.timeit("cli.main()", setup="from __main__ import cli", number=RUNS)
-    print(f"Average - {(t/float(RUNS))}")
+    parser = argparse.ArgumentParser(
+        description="Benchmark the cli; any arguments not listed here are passed through to cli.py"
+    )
+    parser.add_argument(
+        "--json",
+        default=None,
+        help="Also write the results as JSON to this path"
+    )
+    parser.add_argument(
+        "--memory",
+        default=None,
+        help="Also measure each solver's memory use with tracemalloc, writing the results as JSON to this path"
+    )
+    parser.add_argument(
+        "--memory-puzzles",
+        default=None,
+        nargs="+",
+        help="The puzzles --memory measures; defaults to ./data/*.txt and any generated easy puzzles, ./data/<size>/easy/*.txt"
+    )
+    parser.add_argument(
+        "--memory-solvers",
+        default=None,
+        nargs="+",
+        help="The solvers --memory measures; defaults to all of them"
+    )
+    (args, cli_args) = parser.parse_known_args()
+    runs = Config.getInt("BENCHMARKING", "RUNS")
+    results = {"runs": runs, "args": cli_args}
+    results["startup"] = measureStartup(runs)
+    print(f"Startup - {results['startup']['startup_average']} (import - {results['startup']['import_average']})")
+    results["solve"] = measureSolve(runs, cli_args)
+    print(f"Average - {results['solve']['average']}")
+    if args.json is not None:
+        with open(args.json, "w") as output:
+            json.dump(results, output, indent=2)
+    if args.memory is not None:
+        memory = measureMemory(args.memory_puzzles, args.memory_solvers)
+        for (size, solvers) in memory["sizes"].items():
+            for (solver, summary) in solvers.items():
+                print(f"Memory {size}x{size} {solver} - peak {summary['peak_average']:.0f} bytes (retained - {summary['retained_average']:.0f})")
+        with open(args.memory, "w") as output:
+            json.dump(memory, output, indent=2)